@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import AbstractSet, Dict, FrozenSet, Iterator, List, Tuple
 
 from .constants import Color
 
@@ -37,6 +37,8 @@ class Building:
     capacity: int = 0
     efficiency: float = 1.0
     builder_id: int | None = None
+    # (position, blueprint, cells) from the last ``cells`` call
+    _cells: tuple | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Initialise stats from the blueprint."""
@@ -58,12 +60,18 @@ class Building:
         self.capacity += 1
         self.efficiency += 0.1
 
-    def cells(self) -> List[Tuple[int, int]]:
+    def cells(self) -> FrozenSet[Tuple[int, int]]:
         """World coordinates occupied by this building."""
-        return [
-            (self.position[0] + dx, self.position[1] + dy)
-            for dx, dy in self.blueprint.footprint
-        ]
+        cached = self._cells
+        if (
+            cached is None
+            or cached[0] != self.position
+            or cached[1] is not self.blueprint
+        ):
+            x, y = self.position
+            cells = frozenset((x + dx, y + dy) for dx, dy in self.blueprint.footprint)
+            cached = self._cells = (self.position, self.blueprint, cells)
+        return cached[2]
 
     @property
     def complete(self) -> bool:
@@ -85,3 +93,79 @@ class Building:
             glyph = self.blueprint.glyph.lower()
 
         return glyph, self.blueprint.color
+
+
+class BuildingIndex:
+    """Cells covered by impassable buildings, kept up to date incrementally.
+
+    Wraps the game's building list.  :meth:`blocked` compares every building
+    with the state recorded when its cells were last indexed and only adds or
+    clears the footprints that moved or toggled ``passable``, so pathfinding
+    reuses one set instead of rebuilding it whenever a building changes.
+    """
+
+    def __init__(self, buildings: List[Building] | None = None) -> None:
+        self.buildings: List[Building] = buildings if buildings is not None else []
+        # id(building) -> (building, indexed state, indexed cells)
+        self._entries: Dict[
+            int, Tuple[Building, tuple, FrozenSet[Tuple[int, int]]]
+        ] = {}
+        # Cell -> number of impassable buildings covering it
+        self._counts: Dict[Tuple[int, int], int] = {}
+        # Bumped whenever a footprint is added to or cleared from ``_counts``
+        self.version = 0
+
+    def __iter__(self) -> Iterator[Building]:
+        return iter(self.buildings)
+
+    def __len__(self) -> int:
+        return len(self.buildings)
+
+    def add(self, building: Building) -> None:
+        """Append ``building`` to the list and index its cells."""
+        self.buildings.append(building)
+        self._index(building)
+
+    def remove(self, building: Building) -> None:
+        """Remove ``building`` from the list and clear its cells."""
+        self.buildings.remove(building)
+        self._unindex(id(building))
+
+    def blocked(self) -> AbstractSet[Tuple[int, int]]:
+        """Return the cells currently covered by impassable buildings."""
+        entries = self._entries
+        for b in self.buildings:
+            entry = entries.get(id(b))
+            if entry is None or entry[1] != (b.position, b.blueprint, b.passable):
+                self._unindex(id(b))
+                self._index(b)
+        if len(entries) != len(self.buildings):
+            live = {id(b) for b in self.buildings}
+            for key in [k for k in entries if k not in live]:
+                self._unindex(key)
+        return self._counts.keys()
+
+    # ------------------------------------------------------------------
+    def _index(self, building: Building) -> None:
+        cells = frozenset() if building.passable else building.cells()
+        state = (building.position, building.blueprint, building.passable)
+        self._entries[id(building)] = (building, state, cells)
+        counts = self._counts
+        for cell in cells:
+            counts[cell] = counts.get(cell, 0) + 1
+        if cells:
+            self.version += 1
+
+    def _unindex(self, key: int) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        counts = self._counts
+        for cell in entry[2]:
+            left = counts[cell] - 1
+            if left:
+                counts[cell] = left
+            else:
+                del counts[cell]
+        if entry[2]:
+            self.version += 1
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Iterable
 
 from .constants import (
     VIEWPORT_WIDTH,
@@ -63,6 +64,15 @@ class Camera:
         sy = (wy - self.y) * self.zoom
         return sx, sy
 
+    def world_to_screen_batch(
+        self, points: Iterable[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        """Translate many world coordinates to screen coordinates at once."""
+        zoom = self.zoom
+        ox = self.x
+        oy = self.y
+        return [((wx - ox) * zoom, (wy - oy) * zoom) for wx, wy in points]
+
     def center(self, map_width: int, map_height: int) -> None:
         """Center the camera on the map."""
         self.x = max(0, (map_width // 2) - (self.visible_tiles_x // 2))
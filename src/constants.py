@@ -50,6 +50,36 @@ MAX_STORAGE = 100
 # progression.
 SEARCH_LIMIT = 50000
 
+# Extra tiles around the start/goal box searched by the flat-array A* before
+# it hands over to the unbounded search.
+ASTAR_WINDOW_MARGIN = 16
+# Trips at least this long that leave the window are searched from both ends.
+BIDIR_MIN_DISTANCE = 32
+
+# Extra tiles around the start/goal bounding box scanned by the jump point
+# search before falling back to plain A*.
+JPS_MARGIN = 32
+# Shorter trips go straight to A*; scanning the jump point window costs more
+# than the handful of nodes A* expands for them.
+JPS_MIN_DISTANCE = 24
+
+# Side length of the square map chunks whose resource clusters are cached.
+CLUSTER_CHUNK = 16
+# Distance around a villager searched for cached resource clusters before the
+# plain breadth-first search is used.
+CLUSTER_RADIUS = 32
+
+# Routes kept by the game's path cache before the least recently used one is
+# dropped.
+PATH_CACHE_SIZE = 4096
+
+# Side length of the square cells completed buildings are bucketed into for
+# the Blacksmith/Quarry proximity and Road lookups.
+SITE_CHUNK = 5
+
+# Side length of the blocks used by the hierarchical pathfinder's portal graph.
+PORTAL_BLOCK = 16
+
 # Fixed colour for all UI elements (RGB)
 UI_COLOR_RGB = (255, 255, 255)
 
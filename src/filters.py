@@ -101,3 +101,17 @@ def zone_filter(color: ColorRGB, tile: Tile, day_fraction: float) -> ColorRGB:
     g = int(color[1] * (1 - blend) + tint[1] * blend)
     b = int(color[2] * (1 - blend) + tint[2] * blend)
     return (r, g, b)
+
+
+# Packed colours ------------------------------------------------------
+
+
+def pack_rgb(color: ColorRGB) -> int:
+    """Pack ``color`` into a single ``0xRRGGBB`` integer."""
+    r, g, b = color
+    return (r << 16) | (g << 8) | b
+
+
+def unpack_rgb(value: int) -> ColorRGB:
+    """Split a ``0xRRGGBB`` integer back into its channels."""
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
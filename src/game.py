@@ -4,25 +4,28 @@ from __future__ import annotations
 import logging
 import random
 import time
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterator, List, Tuple, Optional
 
 from .constants import (
     TileType,
     TICK_RATE,
     UI_REFRESH_INTERVAL,
     MAX_STORAGE,
+    PATH_CACHE_SIZE,
     SEARCH_LIMIT,
+    SITE_CHUNK,
     STATUS_PANEL_Y,
     ZoneType,
     LifeStage,
     Role,
 )
 
-from .building import BuildingBlueprint, Building
+from .building import BuildingBlueprint, Building, BuildingIndex
+from .job import Job
 from .tile import Tile
 from .map import GameMap, Zone
+from .pathfinding import find_path_fast, nearest_passable
 from .renderer import Renderer
 from .camera import Camera
 from .villager import Villager
@@ -31,15 +34,6 @@ from .world import World
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class Job:
-    """Simple job descriptor used by the dispatcher."""
-
-    type: str  # "gather" or "build"
-    payload: object | None = None
-    target_villager: int | None = None
-
-
 class Game:
     """Owns game state and runs the main loop."""
 
@@ -49,7 +43,21 @@ class Game:
         if preview:
             self.map.terrain.display_preview()
         self.entities: List[Villager] = []
+        # Villagers by the tile they stand on, rebuilt when
+        # ``_villagers_stamp`` goes stale and kept current as they step; see
+        # ``villagers_near``
+        self._villager_grid: Dict[Tuple[int, int], List[Villager]] = {}
+        self._villagers_stamp: Tuple[int, int] | None = None
         self.buildings: List[Building] = []
+        # Blocked cells of ``buildings`` shared by every path search
+        self.building_index = BuildingIndex(self.buildings)
+        # Completed buildings by blueprint name, then by ``SITE_CHUNK`` cell,
+        # rebuilt when ``_sites_stamp`` goes stale; see ``completed_near``
+        self._sites: Dict[str, Dict[Tuple[int, int], List[Building]]] = {}
+        self._sites_stamp: Tuple[int, int] | None = None
+        # (start, goal, search limit, map version, building index version)
+        # -> route, most recently used last; see ``cached_path``
+        self.path_cache: OrderedDict[tuple, List[Tuple[int, int]]] = OrderedDict()
         self.build_queue: List[Building] = []
         self.jobs: List[Job] = []
         # Focus early gameplay on gathering wood for the very first house.
@@ -131,7 +139,7 @@ class Game:
         rock_pos = (self.townhall_pos[0] - 3, self.townhall_pos[1])
         # Provide a generous amount so road construction can continue
         # throughout the test run.
-        self.map._tiles[rock_pos] = Tile(TileType.ROCK, 500, True)
+        self.map.set_tile(*rock_pos, Tile(TileType.ROCK, 500, True))
 
         # Reserve some storage capacity for resources gathered later
         reserve = 20
@@ -280,6 +288,82 @@ class Game:
             vill.role = role
             counts[role].append(vill)
 
+    # --- Neighbour Lookups -------------------------------------------
+    def _villagers_by_tile(self) -> Dict[Tuple[int, int], List[Villager]]:
+        # Rebuilt at most once per tick, or when a villager is added
+        stamp = (self.tick_count, len(self.entities))
+        if self._villagers_stamp != stamp:
+            grid: Dict[Tuple[int, int], List[Villager]] = {}
+            for v in self.entities:
+                grid.setdefault(v.position, []).append(v)
+            self._villager_grid = grid
+            self._villagers_stamp = stamp
+        return self._villager_grid
+
+    def villagers_near(self, pos: Tuple[int, int]) -> List[Villager]:
+        """Return the villagers on ``pos`` and the eight tiles around it."""
+        grid = self._villagers_by_tile()
+        x, y = pos
+        found: List[Villager] = []
+        for ny in (y - 1, y, y + 1):
+            for nx in (x - 1, x, x + 1):
+                here = grid.get((nx, ny))
+                if here:
+                    found.extend(here)
+        return found
+
+    def villagers_at(self, pos: Tuple[int, int]) -> List[Villager]:
+        """Return the villagers standing on ``pos``."""
+        return self._villagers_by_tile().get(pos, [])
+
+    def villager_moved(self, villager: Villager, old: Tuple[int, int]) -> None:
+        """Move ``villager`` from ``old`` to its new tile in the lookup."""
+        if self._villagers_stamp is None:
+            return
+        grid = self._villager_grid
+        here = grid.get(old, [])
+        for i, v in enumerate(here):
+            if v is villager:
+                del here[i]
+                if not here:
+                    del grid[old]
+                break
+        grid.setdefault(villager.position, []).append(villager)
+
+    # --- Pathfinding -------------------------------------------------
+    def cached_path(
+        self, start: Tuple[int, int], goal: Tuple[int, int]
+    ) -> List[Tuple[int, int]]:
+        """Return ``find_path_fast`` from ``start`` to ``goal``, memoised.
+
+        Entries are keyed on the map and building index versions, so a tile
+        or footprint change simply makes older routes unreachable.  A cached
+        route between the same tiles in the opposite direction is reversed
+        rather than searched again.  Callers must not modify the returned
+        list.
+        """
+        limit = self.get_search_limit()
+        self.building_index.blocked()
+        key = (start, goal, limit, self.map.version, self.building_index.version)
+        cache = self.path_cache
+        path = cache.get(key)
+        if path is not None:
+            cache.move_to_end(key)
+            return path
+        # Moves cost the same both ways, so a route found in the other
+        # direction (usually the trip out to a resource) serves in reverse.
+        back = cache.get((goal, start) + key[2:])
+        if back:
+            path = back[::-1]
+        else:
+            path = find_path_fast(
+                start, goal, self.map, self.building_index, search_limit=limit
+            )
+        cache[key] = path
+        if len(cache) > PATH_CACHE_SIZE:
+            cache.popitem(last=False)
+        return path
+
     # --- Usage Tracking ---------------------------------------------
     def record_tile_usage(self, pos: Tuple[int, int]) -> None:
         """Increment usage counter for ``pos``."""
@@ -304,6 +388,14 @@ class Game:
             key=lambda s: abs(s[0] - pos[0]) + abs(s[1] - pos[1]),
         )
 
+    def remove_from_build_queue(self, building: Building) -> None:
+        """Drop ``building`` itself, not an equal copy, from the build queue."""
+        queue = self.build_queue
+        for i, queued in enumerate(queue):
+            if queued is building:
+                del queue[i]
+                return
+
     def _assign_builder(self, building: Building, role: Role = Role.BUILDER) -> None:
         """Assign the nearest villager with ``role`` to construct ``building``."""
         if building.complete:
@@ -428,30 +520,7 @@ class Game:
 
     def _find_nearest_passable(self, origin: Tuple[int, int]) -> Tuple[int, int]:
         """Return the closest passable tile to ``origin``."""
-        from collections import deque
-
-        q = deque([origin])
-        visited = {origin}
-        searched = 0
-        while q and searched < SEARCH_LIMIT:
-            x, y = q.popleft()
-            searched += 1
-            if self.map.get_tile(x, y).passable:
-                return (x, y)
-            for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                nx, ny = x + dx, y + dy
-                if (
-                    0 <= nx < self.map.width
-                    and 0 <= ny < self.map.height
-                    and (nx, ny) not in visited
-                ):
-                    visited.add((nx, ny))
-                    q.append((nx, ny))
-        logger.debug(
-            "_find_nearest_passable hit search limit from %s",
-            origin,
-        )
-        return origin
+        return nearest_passable(origin, self.map)
 
     def _count_resource_nearby(
         self, origin: Tuple[int, int], resource: TileType, radius: int
@@ -474,15 +543,15 @@ class Game:
             for y in range(zone.y, zone.y + zone.height):
                 tile = self.map.get_tile(x, y)
                 if tile.type is TileType.TREE:
-                    gained = tile.extract(tile.resource_amount)
+                    gained = self.map.extract_tile(x, y, tile, tile.resource_amount)
                     self.adjust_storage("wood", gained)
                 elif tile.type is TileType.ROCK:
-                    gained = tile.extract(tile.resource_amount)
+                    gained = self.map.extract_tile(x, y, tile, tile.resource_amount)
                     self.adjust_storage("stone", gained)
                 elif tile.type is TileType.WATER:
                     # Flatten water tiles in the starting zones so initial
                     # building sites are always passable.
-                    self.map._tiles[(x, y)] = Tile(TileType.GRASS, 0, True)
+                    self.map.set_tile(x, y, Tile(TileType.GRASS, 0, True))
 
     def _expand_zone(self, zone: Zone, dx: int = 10, dy: int = 0) -> None:
         """Expand ``zone`` and update the map."""
@@ -490,11 +559,52 @@ class Game:
         zone.height += dy
         self.map.add_zone(zone)
 
+    def invalidate_sites(self) -> None:
+        """Drop the completed-building lookup after a building completes."""
+        self._sites_stamp = None
+
+    def _completed_sites(self) -> Dict[str, Dict[Tuple[int, int], List[Building]]]:
+        # Rebuilt at most once per tick, or when a building is added
+        stamp = (self.tick_count, len(self.buildings))
+        if self._sites_stamp != stamp:
+            sites: Dict[str, Dict[Tuple[int, int], List[Building]]] = {}
+            for b in self.buildings:
+                if b.complete:
+                    key = (b.position[0] // SITE_CHUNK, b.position[1] // SITE_CHUNK)
+                    chunks = sites.setdefault(b.blueprint.name, {})
+                    chunks.setdefault(key, []).append(b)
+            self._sites = sites
+            self._sites_stamp = stamp
+        return self._sites
+
+    def _completed(self, name: str) -> Iterator[Building]:
+        """Yield every completed ``name`` building, grouped by chunk."""
+        for chunk in self._completed_sites().get(name, {}).values():
+            yield from chunk
+
+    def completed_near(
+        self, name: str, pos: Tuple[int, int], radius: int
+    ) -> Optional[Building]:
+        """Return a completed ``name`` building within ``radius`` of ``pos``.
+
+        Distance is measured per axis from the building's position, so only
+        the ``SITE_CHUNK`` cells overlapping that square are examined.
+        """
+        chunks = self._completed_sites().get(name)
+        if not chunks:
+            return None
+        x, y = pos
+        for cy in range((y - radius) // SITE_CHUNK, (y + radius) // SITE_CHUNK + 1):
+            for cx in range((x - radius) // SITE_CHUNK, (x + radius) // SITE_CHUNK + 1):
+                for b in chunks.get((cx, cy), ()):
+                    bx, by = b.position
+                    if abs(bx - x) <= radius and abs(by - y) <= radius:
+                        return b
+        return None
+
     def get_search_limit(self) -> int:
         """Return BFS search limit factoring in built Watchtowers."""
-        bonus = sum(
-            1 for b in self.buildings if b.blueprint.name == "Watchtower" and b.complete
-        )
+        bonus = sum(1 for _ in self._completed("Watchtower"))
         return SEARCH_LIMIT + bonus * 5000
 
     # --- Building Helpers --------------------------------------------
@@ -656,11 +766,7 @@ class Game:
 
     def _count_buildings(self, name: str, min_level: int = 1) -> int:
         """Return count of completed buildings named ``name`` at ``min_level`` or higher."""
-        return sum(
-            1
-            for b in self.buildings
-            if b.blueprint.name == name and b.level >= min_level and b.complete
-        )
+        return sum(1 for b in self._completed(name) if b.level >= min_level)
 
     def _townhall_requirements(self) -> Dict[str, int]:
         """Return minimal building counts required for the next upgrade."""
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class Job:
+    """Simple job descriptor used by the dispatcher."""
+
+    type: str  # "gather" or "build"
+    payload: object | None = None
+    target_villager: int | None = None
@@ -1,9 +1,10 @@
-from dataclasses import dataclass
-from typing import Dict, Tuple
+from array import array
+from dataclasses import dataclass, field
+from typing import Collection, Dict, List, Set, Tuple
 
 from .terrain import TerrainGenerator
 
-from .constants import MAP_WIDTH, MAP_HEIGHT, TileType, ZoneType
+from .constants import CLUSTER_CHUNK, MAP_WIDTH, MAP_HEIGHT, TileType, ZoneType
 from .tile import Tile
 
 
@@ -18,6 +19,50 @@ class Zone:
     height: int
 
 
+@dataclass
+class ResourceCluster:
+    """Connected group of resource tiles inside one map chunk."""
+
+    tiles: List[Tuple[int, int]]
+    # Inclusive bounding box as (min_x, min_y, max_x, max_y)
+    bbox: Tuple[int, int, int, int]
+    # Packed copies of the tile coordinates for fast distance scans
+    xs: array = field(init=False, repr=False, compare=False)
+    ys: array = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.xs = array("i", [p[0] for p in self.tiles])
+        self.ys = array("i", [p[1] for p in self.tiles])
+
+    def distance_bound(self, x: int, y: int) -> int:
+        """Manhattan distance from ``(x, y)`` to the bounding box."""
+        min_x, min_y, max_x, max_y = self.bbox
+        dx = min_x - x if x < min_x else x - max_x if x > max_x else 0
+        dy = min_y - y if y < min_y else y - max_y if y > max_y else 0
+        return dx + dy
+
+    def nearest(
+        self, x: int, y: int, avoid: Collection[Tuple[int, int]] = ()
+    ) -> Tuple[Tuple[int, int] | None, int]:
+        """Return the tile closest to ``(x, y)`` and its Manhattan distance.
+
+        The scan stops early once a tile on the bounding box bound is found.
+        """
+        bound = self.distance_bound(x, y)
+        best: Tuple[int, int] | None = None
+        best_d = -1
+        for px, py in zip(self.xs, self.ys):
+            d = abs(px - x) + abs(py - y)
+            if best is not None and d >= best_d:
+                continue
+            if avoid and (px, py) in avoid:
+                continue
+            best, best_d = (px, py), d
+            if d == bound:
+                break
+        return best, best_d
+
+
 class GameMap:
     """Represents the game world as a grid of tiles."""
 
@@ -31,6 +76,17 @@ class GameMap:
         self._tiles: Dict[Tuple[int, int], Tile] = {}
         # Map of coordinates to zone type
         self._zones: Dict[Tuple[int, int], ZoneType] = {}
+        # Resource clusters per (type, chunk_x, chunk_y), filled on demand
+        self._clusters: Dict[Tuple[TileType, int, int], List[ResourceCluster]] = {}
+        # Passability keyed by ``y * width + x``; filled on first query
+        self._passable: Dict[int, bool] = {}
+        # Bumped whenever a tile changes after generation
+        self.version = 0
+        # Sets handed out by ``track_changes``; each collects changed tiles
+        # until its owner clears it
+        self._change_sets: List[Set[Tuple[int, int]]] = []
+        # Bumped whenever a zone is added
+        self.zone_version = 0
         # Ensure origin is always passable for deterministic tests
         self._tiles[(0, 0)] = Tile(TileType.GRASS, 0, True)
         self._clear_start_area()
@@ -56,9 +112,140 @@ class GameMap:
         tile.zone = self._zones.get(key)
         return tile
 
+    def passable(self, x: int, y: int) -> bool:
+        """Return whether the tile at ``x,y`` can be walked on."""
+        key = y * self.width + x
+        cached = self._passable.get(key)
+        if cached is None:
+            cached = self._passable[key] = self.get_tile(x, y).passable
+        return cached
+
+    def passable_cache(self) -> Dict[int, bool]:
+        """Return the live passability cache for hot search loops.
+
+        Keys are ``y * width + x``.  A missing key only means the tile has
+        not been queried yet; call :meth:`passable` to fill it.
+        """
+        return self._passable
+
+    def set_tile(self, x: int, y: int, tile: Tile) -> None:
+        """Replace the tile at ``x,y`` and drop caches derived from it."""
+        self._tiles[(x, y)] = tile
+        self._invalidate(x, y)
+
+    def extract(self, x: int, y: int, amount: int) -> int:
+        """Remove up to ``amount`` resources from the tile at ``x,y``."""
+        return self.extract_tile(x, y, self.get_tile(x, y), amount)
+
+    def extract_tile(self, x: int, y: int, tile: Tile, amount: int) -> int:
+        """Like :meth:`extract` for a ``tile`` already fetched from ``x,y``."""
+        removed = tile.extract(amount)
+        if removed and tile.resource_amount == 0:
+            self._invalidate(x, y)
+        return removed
+
+    def track_changes(self) -> Set[Tuple[int, int]]:
+        """Return a set that collects every tile changed from now on.
+
+        The caller reads and clears the set when it catches up, so it only
+        ever holds tiles changed since then.
+        """
+        changed: Set[Tuple[int, int]] = set()
+        self._change_sets.append(changed)
+        return changed
+
+    def _invalidate(self, x: int, y: int) -> None:
+        for changed in self._change_sets:
+            changed.add((x, y))
+        self._passable.pop(y * self.width + x, None)
+        self.version += 1
+        cx, cy = x // CLUSTER_CHUNK, y // CLUSTER_CHUNK
+        for resource in (TileType.TREE, TileType.ROCK):
+            self._clusters.pop((resource, cx, cy), None)
+
+    # --- Resource clusters ---------------------------------------------
+    def resource_clusters(
+        self, resource: TileType, x0: int, y0: int, x1: int, y1: int
+    ) -> List[ResourceCluster]:
+        """Return clusters of ``resource`` overlapping the given rectangle.
+
+        Clusters are flood filled once per chunk and cached until a tile in
+        that chunk is depleted or replaced.
+        """
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(self.width - 1, x1), min(self.height - 1, y1)
+        found: List[ResourceCluster] = []
+        for cy in range(y0 // CLUSTER_CHUNK, y1 // CLUSTER_CHUNK + 1):
+            for cx in range(x0 // CLUSTER_CHUNK, x1 // CLUSTER_CHUNK + 1):
+                key = (resource, cx, cy)
+                clusters = self._clusters.get(key)
+                if clusters is None:
+                    clusters = self._compute_clusters(resource, cx, cy)
+                    self._clusters[key] = clusters
+                for cluster in clusters:
+                    bx0, by0, bx1, by1 = cluster.bbox
+                    if bx1 >= x0 and bx0 <= x1 and by1 >= y0 and by0 <= y1:
+                        found.append(cluster)
+        return found
+
+    def _compute_clusters(
+        self, resource: TileType, cx: int, cy: int
+    ) -> List[ResourceCluster]:
+        """Label the connected resource tiles of one chunk as clusters.
+
+        Tiles are read once into a byte mask; the labelling pass then only
+        touches local indices.
+        """
+        x0, y0 = cx * CLUSTER_CHUNK, cy * CLUSTER_CHUNK
+        w = min(self.width, x0 + CLUSTER_CHUNK) - x0
+        h = min(self.height, y0 + CLUSTER_CHUNK) - y0
+        mask = bytearray(w * h)
+        i = 0
+        for y in range(y0, y0 + h):
+            for x in range(x0, x0 + w):
+                tile = self.get_tile(x, y)
+                if tile.type is resource and tile.resource_amount > 0:
+                    mask[i] = 1
+                i += 1
+
+        clusters: List[ResourceCluster] = []
+        for seed in range(w * h):
+            if not mask[seed]:
+                continue
+            mask[seed] = 0
+            stack = [seed]
+            tiles = []
+            min_x = min_y = CLUSTER_CHUNK
+            max_x = max_y = -1
+            while stack:
+                idx = stack.pop()
+                ly, lx = divmod(idx, w)
+                tiles.append((x0 + lx, y0 + ly))
+                min_x, max_x = min(min_x, lx), max(max_x, lx)
+                min_y, max_y = min(min_y, ly), max(max_y, ly)
+                if lx > 0 and mask[idx - 1]:
+                    mask[idx - 1] = 0
+                    stack.append(idx - 1)
+                if lx < w - 1 and mask[idx + 1]:
+                    mask[idx + 1] = 0
+                    stack.append(idx + 1)
+                if ly > 0 and mask[idx - w]:
+                    mask[idx - w] = 0
+                    stack.append(idx - w)
+                if ly < h - 1 and mask[idx + w]:
+                    mask[idx + w] = 0
+                    stack.append(idx + w)
+            clusters.append(
+                ResourceCluster(
+                    tiles, (x0 + min_x, y0 + min_y, x0 + max_x, y0 + max_y)
+                )
+            )
+        return clusters
+
     def add_zone(self, zone: "Zone") -> None:
         """Mark a rectangular area as belonging to ``zone``."""
         for x in range(zone.x, zone.x + zone.width):
             for y in range(zone.y, zone.y + zone.height):
                 if 0 <= x < self.width and 0 <= y < self.height:
                     self._zones[(x, y)] = zone.type
+        self.zone_version += 1
@@ -2,48 +2,207 @@ from __future__ import annotations
 
 import heapq
 import logging
-import random
-from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+import threading
+import weakref
+from array import array
+from collections import deque
+from typing import (
+    AbstractSet,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from .constants import SEARCH_LIMIT, TileType
+from .building import BuildingIndex
+from .constants import (
+    ASTAR_WINDOW_MARGIN,
+    BIDIR_MIN_DISTANCE,
+    CLUSTER_RADIUS,
+    JPS_MARGIN,
+    JPS_MIN_DISTANCE,
+    PORTAL_BLOCK,
+    SEARCH_LIMIT,
+    TileType,
+)
 from .map import GameMap
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(order=True)
-class _Node:
-    f: int
-    count: int
-    pos: Tuple[int, int] = field(compare=False)
-
-
-def _neighbors(pos: Tuple[int, int], gmap: GameMap) -> Iterable[Tuple[int, int]]:
-    x, y = pos
-    neighbors: List[Tuple[int, int]] = []
-    if x > 0:
-        neighbors.append((x - 1, y))
-    if x < gmap.width - 1:
-        neighbors.append((x + 1, y))
-    if y > 0:
-        neighbors.append((x, y - 1))
-    if y < gmap.height - 1:
-        neighbors.append((x, y + 1))
-    random.shuffle(neighbors)
-    for n in neighbors:
-        yield n
-
-
-def _passable(pos: Tuple[int, int], gmap: GameMap, buildings: Iterable[object]) -> bool:
-    tile = gmap.get_tile(*pos)
-    if not tile.passable:
-        return False
-    for b in buildings:
-        cells = b.cells() if hasattr(b, "cells") else [getattr(b, "position", (0, 0))]
-        if pos in cells and not getattr(b, "passable", False):
-            return False
-    return True
+class _AStarScratch:
+    """Containers reused by successive :func:`find_path` calls.
+
+    The map is too large for index-addressed arrays, so the scratch space is
+    the usual dicts and lists.  Clearing them keeps their allocated storage,
+    which spares the allocator when many short searches run in one tick.
+    """
+
+    __slots__ = ("open_list", "came", "g_score")
+
+    def __init__(self) -> None:
+        # Heap entries are single ints with the packed node in the low part
+        self.open_list: List[int] = []
+        self.came: Dict[int, int] = {}
+        self.g_score: Dict[int, int] = {}
+
+    def reset(self) -> None:
+        self.open_list.clear()
+        self.came.clear()
+        self.g_score.clear()
+
+
+_ASTAR_SCRATCH = threading.local()
+
+
+def _astar_scratch() -> _AStarScratch:
+    scratch = getattr(_ASTAR_SCRATCH, "scratch", None)
+    if scratch is None:
+        scratch = _AStarScratch()
+        _ASTAR_SCRATCH.scratch = scratch
+    scratch.reset()
+    return scratch
+
+
+_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+# ``_OFFSETS`` rotated by 0-3 places; breadth-first searches pick one per
+# expansion so ties do not always favour the same direction.
+_ROTATED_OFFSETS = tuple(_OFFSETS[i:] + _OFFSETS[:i] for i in range(4))
+
+
+# (identity, position and blueprint of each impassable building, their cells)
+# from the most recent call; successive searches usually pass the same
+# ``game.buildings`` list unchanged.
+_last_blocked: Tuple[tuple, FrozenSet[Tuple[int, int]]] = ((), frozenset())
+
+
+def _blocked_cells(buildings: Iterable[object]) -> AbstractSet[Tuple[int, int]]:
+    """Return the cells covered by impassable buildings."""
+    global _last_blocked
+    if isinstance(buildings, BuildingIndex):
+        return buildings.blocked()
+    solid = [b for b in buildings if not getattr(b, "passable", False)]
+    key = tuple(
+        (id(b), getattr(b, "position", (0, 0)), getattr(b, "blueprint", None))
+        for b in solid
+    )
+    if key == _last_blocked[0]:
+        return _last_blocked[1]
+    blocked: Set[Tuple[int, int]] = set()
+    for b in solid:
+        if hasattr(b, "cells"):
+            blocked.update(b.cells())
+        else:
+            blocked.add(getattr(b, "position", (0, 0)))
+    cells = frozenset(blocked)
+    _last_blocked = (key, cells)
+    return cells
+
+
+def _passable(
+    pos: Tuple[int, int], gmap: GameMap, blocked: Collection[Tuple[int, int]]
+) -> bool:
+    """Return whether ``pos`` is open terrain not covered by ``blocked``."""
+    return pos not in blocked and gmap.passable(*pos)
+
+
+def _find_path_window(
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    gmap: GameMap,
+    blocked: AbstractSet[Tuple[int, int]],
+    search_limit: int,
+    margin: int = ASTAR_WINDOW_MARGIN,
+) -> Optional[List[Tuple[int, int]]]:
+    """A* over flat arrays covering the start/goal box plus ``margin``.
+
+    Heap entries are single ints ``(f * size + h) * size + node`` so ordering
+    is one integer comparison; among equal ``f`` the node nearer the goal
+    (deeper along its path) comes out first, which keeps A* from filling
+    whole plateaus of equal-cost cells.  g-scores and parents live in
+    ``array('i')`` buffers indexed by node.  Returns ``None`` when the answer may lie
+    outside the window: either no route exists inside it or the route
+    found is long enough that a detour around the window could be shorter.
+    """
+    x0 = max(0, min(start[0], goal[0]) - margin)
+    y0 = max(0, min(start[1], goal[1]) - margin)
+    x1 = min(gmap.width - 1, max(start[0], goal[0]) + margin)
+    y1 = min(gmap.height - 1, max(start[1], goal[1]) + margin)
+    w = x1 - x0 + 1
+    size = w * (y1 - y0 + 1)
+    # 0 = not looked up yet, 1 = walkable, 2 = blocked
+    mask = bytearray(size)
+    for bx, by in blocked:
+        if x0 <= bx <= x1 and y0 <= by <= y1:
+            mask[(by - y0) * w + bx - x0] = 2
+    g = array("i", [-1]) * size
+    came = array("i", [-1]) * size
+    width = gmap.width
+    known = gmap.passable_cache()
+    passable = gmap.passable
+    push = heapq.heappush
+    pop = heapq.heappop
+
+    sx, sy = start[0] - x0, start[1] - y0
+    gx, gy = goal[0] - x0, goal[1] - y0
+    start_idx = sy * w + sx
+    goal_idx = gy * w + gx
+    g[start_idx] = 0
+    h0 = abs(gx - sx) + abs(gy - sy)
+    open_list = [(h0 * size + h0) * size + start_idx]
+    explored = 0
+
+    while open_list and explored < search_limit:
+        key, current = divmod(pop(open_list), size)
+        cy, cx = divmod(current, w)
+        cg = g[current]
+        if key // size != cg + abs(gx - cx) + abs(gy - cy):
+            continue  # superseded by a cheaper push
+        if current == goal_idx:
+            if cg > abs(gx - sx) + abs(gy - sy) + 2 * margin:
+                return None
+            path = [goal]
+            while current != start_idx:
+                current = came[current]
+                py, px = divmod(current, w)
+                path.append((x0 + px, y0 + py))
+            path.reverse()
+            return path
+        explored += 1
+        tentative = cg + 1
+        for n, nx, ny in (
+            (current - 1, cx - 1, cy) if cx > 0 else (-1, 0, 0),
+            (current + 1, cx + 1, cy) if cx < w - 1 else (-1, 0, 0),
+            (current - w, cx, cy - 1) if cy > 0 else (-1, 0, 0),
+            (current + w, cx, cy + 1) if current + w < size else (-1, 0, 0),
+        ):
+            if n < 0:
+                continue
+            ng = g[n]
+            if 0 <= ng <= tentative:
+                continue
+            v = mask[n]
+            if v == 0:
+                open_ = known.get((y0 + ny) * width + x0 + nx)
+                if open_ is None:
+                    open_ = passable(x0 + nx, y0 + ny)
+                v = mask[n] = 1 if open_ else 2
+            if v == 2:
+                continue
+            g[n] = tentative
+            came[n] = current
+            h = abs(gx - nx) + abs(gy - ny)
+            push(open_list, ((tentative + h) * size + h) * size + n)
+
+    if open_list:
+        logger.debug("find_path failed from %s to %s after %d", start, goal, explored)
+        return []
+    return None
 
 
 def find_path(
@@ -54,46 +213,349 @@ def find_path(
     *,
     search_limit: int = SEARCH_LIMIT,
 ) -> List[Tuple[int, int]]:
-    """Simple A* pathfinding returning a list of waypoints."""
-    if buildings is None:
-        buildings = []
-    open_list: List[_Node] = []
-    heapq.heappush(open_list, _Node(0, 0, start))
-    came: Dict[Tuple[int, int], Tuple[int, int]] = {}
-    g_score: Dict[Tuple[int, int], int] = {start: 0}
-    closed: Set[Tuple[int, int]] = set()
-    count = 1
+    """Simple A* pathfinding returning a list of waypoints.
+
+    The search first runs on a flat grid around ``start`` and ``goal``; only
+    if that window cannot prove the shortest route does it continue over
+    the whole map, bidirectionally for long trips.  Nodes are packed as
+    ``y * width + x`` so the score tables hash plain ints instead of
+    coordinate tuples.
+    """
+    width, height = gmap.width, gmap.height
+    cells = _blocked_cells(buildings or [])
+    windowed = _find_path_window(start, goal, gmap, cells, search_limit)
+    if windowed is not None:
+        return windowed
+    if abs(goal[0] - start[0]) + abs(goal[1] - start[1]) >= BIDIR_MIN_DISTANCE:
+        return find_path_bidir(
+            start, goal, gmap, buildings, search_limit=search_limit
+        )
+    blocked = {y * width + x for x, y in cells}
+    scratch = _astar_scratch()
+    open_list = scratch.open_list
+    # One int per heap entry: f, then h to break ties towards the goal, then
+    # the node in the low part
+    stride = width * height
+    span = width + height
+    start_idx = start[1] * width + start[0]
+    goal_idx = goal[1] * width + goal[0]
+    gx, gy = goal
+    h0 = abs(gx - start[0]) + abs(gy - start[1])
+    open_list.append((h0 * span + h0) * stride + start_idx)
+    came = scratch.came
+    g_score = scratch.g_score
+    g_score[start_idx] = 0
     explored = 0
+    # Packed node ids match the map's passability cache keys
+    known = gmap.passable_cache()
+    passable = gmap.passable
+    push = heapq.heappush
+    pop = heapq.heappop
+
+    def visit(nx: int, ny: int, n: int, current: int, tentative: int) -> None:
+        if n in blocked or tentative >= g_score.get(n, 1_000_000):
+            return
+        open_ = known.get(n)
+        if open_ is None:
+            open_ = passable(nx, ny)
+        if not open_:
+            return
+        came[n] = current
+        g_score[n] = tentative
+        h = abs(gx - nx) + abs(gy - ny)
+        push(open_list, ((tentative + h) * span + h) * stride + n)
 
     while open_list and explored < search_limit:
-        node = heapq.heappop(open_list)
-        current = node.pos
-        if current == goal:
-            path = [current]
+        key, current = divmod(pop(open_list), stride)
+        y, x = divmod(current, width)
+        cg = g_score[current]
+        # A node is only pushed again with a lower g, so an entry whose f no
+        # longer matches is stale; this replaces a closed set.
+        if key // span != cg + abs(gx - x) + abs(gy - y):
+            continue
+        if current == goal_idx:
+            path = [goal]
             while current in came:
                 current = came[current]
-                path.append(current)
+                y, x = divmod(current, width)
+                path.append((x, y))
             path.reverse()
             return path
-        if current in closed:
+        explored += 1
+        tentative = cg + 1
+        if x > 0:
+            visit(x - 1, y, current - 1, current, tentative)
+        if x < width - 1:
+            visit(x + 1, y, current + 1, current, tentative)
+        if y > 0:
+            visit(x, y - 1, current - width, current, tentative)
+        if y < height - 1:
+            visit(x, y + 1, current + width, current, tentative)
+
+    logger.debug("find_path failed from %s to %s after %d", start, goal, explored)
+    return []
+
+
+def find_path_bidir(
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    gmap: GameMap,
+    buildings: Iterable[object] | None = None,
+    *,
+    search_limit: int = SEARCH_LIMIT,
+) -> List[Tuple[int, int]]:
+    """A* run from both ends at once, meeting in the middle.
+
+    Each step expands whichever frontier currently has fewer open entries.
+    The search stops once the cheapest meeting found is no worse than the
+    lowest ``f`` left on either side, and it gives up as soon as either side
+    runs out of tiles, which makes goals in enclosed areas cheap to reject.
+    """
+    if start == goal:
+        return [start]
+    width, height = gmap.width, gmap.height
+    blocked = {y * width + x for x, y in _blocked_cells(buildings or [])}
+    known = gmap.passable_cache()
+    passable = gmap.passable
+    sx, sy = start
+    gx, gy = goal
+    start_idx = sy * width + sx
+    goal_idx = gy * width + gx
+    if goal_idx in blocked or not passable(gx, gy):
+        return []
+
+    push = heapq.heappush
+    pop = heapq.heappop
+    estimate = abs(gx - sx) + abs(gy - sy)
+    g_fwd: Dict[int, int] = {start_idx: 0}
+    g_bwd: Dict[int, int] = {goal_idx: 0}
+    came_fwd: Dict[int, int] = {}
+    came_bwd: Dict[int, int] = {}
+    # Heap entries are ``f * stride + node`` as in find_path
+    stride = width * height
+    open_fwd: List[int] = [estimate * stride + start_idx]
+    open_bwd: List[int] = [estimate * stride + goal_idx]
+    best = 1_000_000_000
+    meet = -1
+    explored = 0
+
+    while open_fwd and open_bwd and explored < search_limit:
+        if max(open_fwd[0], open_bwd[0]) // stride >= best:
+            break
+        if len(open_fwd) <= len(open_bwd):
+            heap, g, came, other, tx, ty = open_fwd, g_fwd, came_fwd, g_bwd, gx, gy
+        else:
+            heap, g, came, other, tx, ty = open_bwd, g_bwd, came_bwd, g_fwd, sx, sy
+        f, current = divmod(pop(heap), stride)
+        cy, cx = divmod(current, width)
+        cg = g[current]
+        if f != cg + abs(tx - cx) + abs(ty - cy):
+            continue  # superseded by a cheaper push
+        explored += 1
+        tentative = cg + 1
+        for n, nx, ny in (
+            (current - 1, cx - 1, cy) if cx > 0 else (-1, 0, 0),
+            (current + 1, cx + 1, cy) if cx < width - 1 else (-1, 0, 0),
+            (current - width, cx, cy - 1) if cy > 0 else (-1, 0, 0),
+            (current + width, cx, cy + 1) if cy < height - 1 else (-1, 0, 0),
+        ):
+            if n < 0 or tentative >= g.get(n, 1_000_000_000):
+                continue
+            # The start tile is always enterable, as it is for find_path.
+            if n != start_idx:
+                if n in blocked:
+                    continue
+                open_ = known.get(n)
+                if open_ is None:
+                    open_ = passable(nx, ny)
+                if not open_:
+                    continue
+            g[n] = tentative
+            came[n] = current
+            push(heap, (tentative + abs(tx - nx) + abs(ty - ny)) * stride + n)
+            joined = other.get(n)
+            if joined is not None and tentative + joined < best:
+                best = tentative + joined
+                meet = n
+
+    if meet < 0:
+        logger.debug(
+            "find_path_bidir failed from %s to %s after %d", start, goal, explored
+        )
+        return []
+    path: List[Tuple[int, int]] = []
+    node = meet
+    while True:
+        y, x = divmod(node, width)
+        path.append((x, y))
+        if node == start_idx:
+            break
+        node = came_fwd[node]
+    path.reverse()
+    node = meet
+    while node != goal_idx:
+        node = came_bwd[node]
+        y, x = divmod(node, width)
+        path.append((x, y))
+    return path
+
+
+def find_path_jps(
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    gmap: GameMap,
+    buildings: Iterable[object] | None = None,
+    *,
+    margin: int = JPS_MARGIN,
+    search_limit: int = SEARCH_LIMIT,
+) -> List[Tuple[int, int]]:
+    """Jump point search over a window around ``start`` and ``goal``.
+
+    Every step costs the same, so straight runs are skipped in one go instead
+    of pushing each tile on the open list.  Horizontal moves only continue
+    horizontally unless a forced neighbour appears; vertical moves may branch
+    sideways at every tile.  Tiles outside the window are treated as walls,
+    so an empty result only means no path exists *inside* the window.
+    """
+    blocked = _blocked_cells(buildings or [])
+    if start == goal:
+        return [start]
+
+    x0 = max(0, min(start[0], goal[0]) - margin)
+    y0 = max(0, min(start[1], goal[1]) - margin)
+    x1 = min(gmap.width - 1, max(start[0], goal[0]) + margin)
+    y1 = min(gmap.height - 1, max(start[1], goal[1]) + margin)
+    w = x1 - x0 + 1
+    h = y1 - y0 + 1
+    # 0 = not looked up yet, 1 = walkable, 2 = blocked
+    mask = bytearray(w * h)
+    for bx, by in blocked:
+        if x0 <= bx <= x1 and y0 <= by <= y1:
+            mask[(by - y0) * w + bx - x0] = 2
+    passable = gmap.passable
+
+    def walkable(lx: int, ly: int) -> bool:
+        i = ly * w + lx
+        v = mask[i]
+        if v == 0:
+            v = 1 if passable(x0 + lx, y0 + ly) else 2
+            mask[i] = v
+        return v == 1
+
+    gx, gy = goal[0] - x0, goal[1] - y0
+    if not walkable(gx, gy):
+        return []
+    goal_idx = gy * w + gx
+
+    def jump_h(lx: int, ly: int, dx: int) -> int:
+        while True:
+            lx += dx
+            if not (0 <= lx < w) or not walkable(lx, ly):
+                return -1
+            if lx == gx and ly == gy:
+                return ly * w + lx
+            if ly > 0 and walkable(lx, ly - 1) and not walkable(lx - dx, ly - 1):
+                return ly * w + lx
+            if (
+                ly < h - 1
+                and walkable(lx, ly + 1)
+                and not walkable(lx - dx, ly + 1)
+            ):
+                return ly * w + lx
+
+    def jump_v(lx: int, ly: int, dy: int) -> int:
+        while True:
+            ly += dy
+            if not (0 <= ly < h) or not walkable(lx, ly):
+                return -1
+            if (
+                (lx == gx and ly == gy)
+                or jump_h(lx, ly, 1) >= 0
+                or jump_h(lx, ly, -1) >= 0
+            ):
+                return ly * w + lx
+
+    sx, sy = start[0] - x0, start[1] - y0
+    start_idx = sy * w + sx
+    open_list: List[Tuple[int, int, int]] = [(0, 0, start_idx)]
+    came: Dict[int, int] = {}
+    g_score: Dict[int, int] = {start_idx: 0}
+    # One byte per window tile; the window is small enough that a flat
+    # bitmap beats hashing every settled index.
+    closed = bytearray(w * h)
+    count = 1
+    explored = 0
+
+    while open_list and explored < search_limit:
+        _, _, current = heapq.heappop(open_list)
+        if current == goal_idx:
+            return _expand_jump_points(current, came, w, x0, y0)
+        if closed[current]:
             continue
-        closed.add(current)
+        closed[current] = 1
         explored += 1
-        for n in _neighbors(current, gmap):
-            if not _passable(n, gmap, buildings):
+        cy, cx = divmod(current, w)
+        parent = came.get(current)
+        if parent is None:
+            dirs = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+        else:
+            py, px = divmod(parent, w)
+            dx = (cx > px) - (cx < px)
+            dy = (cy > py) - (cy < py)
+            if dy == 0:
+                dirs = [(dx, 0)]
+                for fy in (-1, 1):
+                    ny = cy + fy
+                    if (
+                        0 <= ny < h
+                        and walkable(cx, ny)
+                        and not walkable(cx - dx, ny)
+                    ):
+                        dirs.append((0, fy))
+            else:
+                dirs = [(0, dy), (1, 0), (-1, 0)]
+        for dx, dy in dirs:
+            if dy == 0:
+                jp = jump_h(cx, cy, dx)
+            else:
+                jp = jump_v(cx, cy, dy)
+            if jp < 0:
                 continue
-            tentative = g_score[current] + 1
-            if tentative < g_score.get(n, 1_000_000):
-                came[n] = current
-                g_score[n] = tentative
-                f = tentative + abs(goal[0] - n[0]) + abs(goal[1] - n[1])
-                heapq.heappush(open_list, _Node(f, count, n))
+            jy, jx = divmod(jp, w)
+            tentative = g_score[current] + abs(jx - cx) + abs(jy - cy)
+            if tentative < g_score.get(jp, 1_000_000):
+                came[jp] = current
+                g_score[jp] = tentative
+                f = tentative + abs(gx - jx) + abs(gy - jy)
+                heapq.heappush(open_list, (f, count, jp))
                 count += 1
 
-    logger.debug("find_path failed from %s to %s after %d", start, goal, explored)
+    logger.debug("find_path_jps failed from %s to %s after %d", start, goal, explored)
     return []
 
 
+def _expand_jump_points(
+    idx: int, came: Dict[int, int], w: int, x0: int, y0: int
+) -> List[Tuple[int, int]]:
+    """Turn a chain of jump points into a list of single-tile steps."""
+    points = [idx]
+    while idx in came:
+        idx = came[idx]
+        points.append(idx)
+    points.reverse()
+    cy, cx = divmod(points[0], w)
+    path = [(x0 + cx, y0 + cy)]
+    for nxt in points[1:]:
+        ny, nx = divmod(nxt, w)
+        dx = (nx > cx) - (nx < cx)
+        dy = (ny > cy) - (ny < cy)
+        while (cx, cy) != (nx, ny):
+            cx += dx
+            cy += dy
+            path.append((x0 + cx, y0 + cy))
+    return path
+
+
 def find_path_fast(
     start: Tuple[int, int],
     goal: Tuple[int, int],
@@ -103,10 +565,186 @@ def find_path_fast(
     search_limit: int = SEARCH_LIMIT,
     **_: int,
 ) -> List[Tuple[int, int]]:
-    """Compatibility wrapper for the previous fast pathfinder."""
+    """Jump point search with a plain A* fallback.
+
+    Every tile costs the same to enter, so the jump point solver applies to
+    any long trip.  If it cannot find a route inside its window, or the route
+    it finds is long enough that one leaving the window could be shorter, the
+    unbounded A* searches instead.
+    """
+    if not isinstance(buildings, BuildingIndex):
+        buildings = list(buildings or [])
+    if start != goal and not _passable(goal, gmap, _blocked_cells(buildings)):
+        # A* never enters an impassable goal either; skip both searches.
+        return []
+    distance = abs(goal[0] - start[0]) + abs(goal[1] - start[1])
+    if distance >= JPS_MIN_DISTANCE:
+        path = find_path_jps(start, goal, gmap, buildings, search_limit=search_limit)
+        # Tiles outside the window count as walls, so a route longer than a
+        # detour around the window might not be the shortest one.
+        if path and len(path) - 1 <= distance + 2 * JPS_MARGIN:
+            return path
     return find_path(start, goal, gmap, buildings, search_limit=search_limit)
 
 
+class _PortalGraph:
+    """Entrances between map blocks and the distances joining them.
+
+    The map is split into ``size`` x ``size`` blocks.  Each run of open
+    tiles along a block edge gets one portal on either side, and every
+    portal stores its distance to the other portals of its block plus a
+    single step to its partner across the edge.  Blocks are built the first
+    time a search touches them and rebuilt only when a tile or building
+    within one tile of the block changes.
+    """
+
+    def __init__(self, gmap: GameMap, size: int) -> None:
+        self.gmap = gmap
+        self.size = size
+        # Tiles changed since the last ``sync``
+        self._changed = gmap.track_changes()
+        # (bx, by) -> (blocked cells used, portal -> {node: cost})
+        self._blocks: Dict[
+            Tuple[int, int],
+            Tuple[frozenset, Dict[Tuple[int, int], Dict[Tuple[int, int], int]]],
+        ] = {}
+
+    def sync(self) -> None:
+        """Drop blocks next to tiles changed since the last query."""
+        if not self._changed:
+            return
+        size = self.size
+        for x, y in self._changed:
+            for bx in {(x - 1) // size, (x + 1) // size}:
+                for by in {(y - 1) // size, (y + 1) // size}:
+                    self._blocks.pop((bx, by), None)
+        self._changed.clear()
+
+    def bucket(
+        self, blocked: AbstractSet[Tuple[int, int]]
+    ) -> Dict[Tuple[int, int], Set[Tuple[int, int]]]:
+        """Group blocked cells by every block whose border ring they touch."""
+        size = self.size
+        buckets: Dict[Tuple[int, int], Set[Tuple[int, int]]] = {}
+        for x, y in blocked:
+            for bx in {(x - 1) // size, (x + 1) // size}:
+                for by in {(y - 1) // size, (y + 1) // size}:
+                    buckets.setdefault((bx, by), set()).add((x, y))
+        return buckets
+
+    def bounds(self, bx: int, by: int) -> Tuple[int, int, int, int]:
+        x0, y0 = bx * self.size, by * self.size
+        x1 = min(self.gmap.width, x0 + self.size) - 1
+        y1 = min(self.gmap.height, y0 + self.size) - 1
+        return x0, y0, x1, y1
+
+    def links(
+        self, bx: int, by: int, blocked: AbstractSet[Tuple[int, int]]
+    ) -> Dict[Tuple[int, int], Dict[Tuple[int, int], int]]:
+        """Return the portal links of block ``(bx, by)``, building if needed."""
+        signature = frozenset(blocked)
+        cached = self._blocks.get((bx, by))
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        links = self._build(bx, by, blocked)
+        self._blocks[(bx, by)] = (signature, links)
+        return links
+
+    def _build(
+        self, bx: int, by: int, blocked: AbstractSet[Tuple[int, int]]
+    ) -> Dict[Tuple[int, int], Dict[Tuple[int, int], int]]:
+        gmap = self.gmap
+        x0, y0, x1, y1 = self.bounds(bx, by)
+
+        def open_(x: int, y: int) -> bool:
+            return (
+                0 <= x < gmap.width
+                and 0 <= y < gmap.height
+                and (x, y) not in blocked
+                and gmap.passable(x, y)
+            )
+
+        links: Dict[Tuple[int, int], Dict[Tuple[int, int], int]] = {}
+        # (inside cells along the edge, offset to the cell across it)
+        edges = (
+            ([(x1, y) for y in range(y0, y1 + 1)], (1, 0)),
+            ([(x0, y) for y in range(y0, y1 + 1)], (-1, 0)),
+            ([(x, y1) for x in range(x0, x1 + 1)], (0, 1)),
+            ([(x, y0) for x in range(x0, x1 + 1)], (0, -1)),
+        )
+        for cells, (dx, dy) in edges:
+            runs: List[List[Tuple[int, int]]] = [[]]
+            for cx, cy in cells:
+                if open_(cx, cy) and open_(cx + dx, cy + dy):
+                    runs[-1].append((cx, cy))
+                elif runs[-1]:
+                    runs.append([])
+            for run in runs:
+                if run:
+                    px, py = run[len(run) // 2]
+                    links.setdefault((px, py), {})[(px + dx, py + dy)] = 1
+
+        portals = list(links)
+        for portal in portals:
+            dist = _bfs_in_box(portal, (x0, y0, x1, y1), open_)
+            for other in portals:
+                if other != portal and other in dist:
+                    links[portal][other] = dist[other]
+        return links
+
+
+def _bfs_in_box(
+    source: Tuple[int, int],
+    box: Tuple[int, int, int, int],
+    open_: Callable[[int, int], bool],
+) -> Dict[Tuple[int, int], int]:
+    """Breadth-first step counts from ``source`` to every open tile in ``box``."""
+    x0, y0, x1, y1 = box
+    w = x1 - x0 + 1
+    # -1 = unseen; neighbours are reached with plain index arithmetic
+    steps = [-1] * (w * (y1 - y0 + 1))
+    dist = {source: 0}
+    first = (source[1] - y0) * w + source[0] - x0
+    steps[first] = 0
+    q = deque([first])
+
+    def reach(j: int, x: int, y: int, d: int) -> None:
+        if steps[j] < 0:
+            steps[j] = d if open_(x, y) else 1_000_000
+            if steps[j] == d:
+                dist[(x, y)] = d
+                q.append(j)
+
+    while q:
+        i = q.popleft()
+        ly, lx = divmod(i, w)
+        x, y = x0 + lx, y0 + ly
+        d = steps[i] + 1
+        if x < x1:
+            reach(i + 1, x + 1, y, d)
+        if x > x0:
+            reach(i - 1, x - 1, y, d)
+        if y < y1:
+            reach(i + w, x, y + 1, d)
+        if y > y0:
+            reach(i - w, x, y - 1, d)
+    return dist
+
+
+_PORTAL_GRAPHS: "weakref.WeakKeyDictionary[GameMap, _PortalGraph]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _portal_graph(gmap: GameMap) -> _PortalGraph:
+    graph = _PORTAL_GRAPHS.get(gmap)
+    if graph is None:
+        graph = _PortalGraph(gmap, PORTAL_BLOCK)
+        _PORTAL_GRAPHS[gmap] = graph
+    graph.sync()
+    return graph
+
+
 def find_path_hierarchical(
     start: Tuple[int, int],
     goal: Tuple[int, int],
@@ -117,7 +755,90 @@ def find_path_hierarchical(
     step: int = 1,
     search_limit: int = SEARCH_LIMIT,
 ) -> List[Tuple[int, int]]:
-    """Simplified hierarchical pathfinder using a single A* pass."""
+    """Route over the cached portal graph, then refine each leg with A*.
+
+    Trips shorter than ``coarse_distance`` or inside a single block use
+    plain A*.  ``step`` is accepted for backwards compatibility; the block
+    size is :data:`PORTAL_BLOCK`.  If the coarse search fails the plain A*
+    result is returned instead.
+    """
+    if not isinstance(buildings, BuildingIndex):
+        buildings = list(buildings or [])
+    graph = _portal_graph(gmap)
+    size = graph.size
+    sb = (start[0] // size, start[1] // size)
+    gb = (goal[0] // size, goal[1] // size)
+    distance = abs(goal[0] - start[0]) + abs(goal[1] - start[1])
+    if sb == gb or distance < coarse_distance:
+        return find_path(start, goal, gmap, buildings, search_limit=search_limit)
+    blocked = _blocked_cells(buildings)
+    if not _passable(goal, gmap, blocked):
+        return []
+
+    buckets = graph.bucket(blocked)
+    empty: Set[Tuple[int, int]] = set()
+
+    def block_links(b: Tuple[int, int]) -> Dict[Tuple[int, int], Dict[Tuple[int, int], int]]:
+        return graph.links(b[0], b[1], buckets.get(b, empty))
+
+    def open_(x: int, y: int) -> bool:
+        return _passable((x, y), gmap, blocked)
+
+    start_portals = block_links(sb)
+    start_dist = _bfs_in_box(start, graph.bounds(*sb), open_)
+    start_links = {p: start_dist[p] for p in start_portals if p in start_dist}
+    goal_dist = _bfs_in_box(goal, graph.bounds(*gb), open_)
+    goal_links = {p: goal_dist[p] for p in block_links(gb) if p in goal_dist}
+    if not start_links or not goal_links:
+        # One end cannot leave its block, so nothing joins the two; without
+        # this the coarse search would flood the map looking for a way in.
+        return []
+
+    gx, gy = goal
+    open_list: List[Tuple[int, int, Tuple[int, int]]] = [(distance, 0, start)]
+    g_score: Dict[Tuple[int, int], int] = {start: 0}
+    came: Dict[Tuple[int, int], Tuple[int, int]] = {}
+    count = 1
+    explored = 0
+    route: List[Tuple[int, int]] = []
+    while open_list and explored < search_limit:
+        f, _, node = heapq.heappop(open_list)
+        g = g_score[node]
+        if f > g + abs(gx - node[0]) + abs(gy - node[1]):
+            continue
+        if node == goal:
+            route = [node]
+            while node in came:
+                node = came[node]
+                route.append(node)
+            route.reverse()
+            break
+        explored += 1
+        if node == start:
+            edges = dict(start_links)
+        else:
+            edges = dict(block_links((node[0] // size, node[1] // size)).get(node, {}))
+        if node in goal_links:
+            edges[goal] = goal_links[node]
+        for n, cost in edges.items():
+            tentative = g + cost
+            if tentative < g_score.get(n, 1_000_000_000):
+                g_score[n] = tentative
+                came[n] = node
+                f = tentative + abs(gx - n[0]) + abs(gy - n[1])
+                heapq.heappush(open_list, (f, count, n))
+                count += 1
+
+    if route:
+        path = [start]
+        for a, b in zip(route, route[1:]):
+            leg = find_path(a, b, gmap, buildings, search_limit=search_limit)
+            if not leg:
+                break
+            path.extend(leg[1:])
+        else:
+            return path
+    logger.debug("find_path_hierarchical fell back to A* from %s to %s", start, goal)
     return find_path(start, goal, gmap, buildings, search_limit=search_limit)
 
 
@@ -129,22 +850,152 @@ def find_path_to_building_adjacent(
     *,
     search_limit: int = SEARCH_LIMIT,
 ) -> List[Tuple[int, int]]:
+    """Return the shortest path to any open tile beside ``building``."""
     if buildings is None:
         buildings = []
+    blocked = _blocked_cells(buildings)
     cells = building.cells() if hasattr(building, "cells") else [building.position]
+    footprint = frozenset(cells)
     candidates: Set[Tuple[int, int]] = set()
-    for bx, by in cells:
-        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+    for bx, by in footprint:
+        for dx, dy in _OFFSETS:
             cx, cy = bx + dx, by + dy
+            if (cx, cy) in footprint or (cx, cy) in candidates:
+                continue
             if 0 <= cx < gmap.width and 0 <= cy < gmap.height:
-                if _passable((cx, cy), gmap, buildings):
+                if _passable((cx, cy), gmap, blocked):
                     candidates.add((cx, cy))
-    best: List[Tuple[int, int]] = []
-    for cand in candidates:
-        path = find_path(start, cand, gmap, buildings, search_limit=search_limit)
-        if path and (not best or len(path) < len(best)):
-            best = path
-    return best
+    if not candidates:
+        return []
+    return _find_path_multi(start, candidates, gmap, blocked, search_limit)
+
+
+def _find_path_multi(
+    start: Tuple[int, int],
+    goals: Collection[Tuple[int, int]],
+    gmap: GameMap,
+    blocked: AbstractSet[Tuple[int, int]],
+    search_limit: int,
+) -> List[Tuple[int, int]]:
+    """One A* towards whichever of ``goals`` is closest by path length.
+
+    The heuristic is the Manhattan distance to the nearest goal, which stays
+    admissible and consistent, so the first goal settled is the best one.
+    """
+    width, height = gmap.width, gmap.height
+    solid = {y * width + x for x, y in blocked}
+    targets = {y * width + x for x, y in goals}
+    spots = list(goals)
+    known = gmap.passable_cache()
+    passable = gmap.passable
+
+    def estimate(x: int, y: int) -> int:
+        return min(abs(tx - x) + abs(ty - y) for tx, ty in spots)
+
+    scratch = _astar_scratch()
+    open_list = scratch.open_list
+    came = scratch.came
+    g_score = scratch.g_score
+    stride = width * height
+    start_idx = start[1] * width + start[0]
+    g_score[start_idx] = 0
+    open_list.append(estimate(*start) * stride + start_idx)
+    push = heapq.heappush
+    pop = heapq.heappop
+    explored = 0
+
+    while open_list and explored < search_limit:
+        f, current = divmod(pop(open_list), stride)
+        cy, cx = divmod(current, width)
+        cg = g_score[current]
+        if f != cg + estimate(cx, cy):
+            continue  # superseded by a cheaper push
+        if current in targets:
+            path = [(cx, cy)]
+            while current in came:
+                current = came[current]
+                y, x = divmod(current, width)
+                path.append((x, y))
+            path.reverse()
+            return path
+        explored += 1
+        tentative = cg + 1
+        for n, nx, ny in (
+            (current - 1, cx - 1, cy) if cx > 0 else (-1, 0, 0),
+            (current + 1, cx + 1, cy) if cx < width - 1 else (-1, 0, 0),
+            (current - width, cx, cy - 1) if cy > 0 else (-1, 0, 0),
+            (current + width, cx, cy + 1) if cy < height - 1 else (-1, 0, 0),
+        ):
+            if n < 0 or n in solid or tentative >= g_score.get(n, 1_000_000_000):
+                continue
+            open_ = known.get(n)
+            if open_ is None:
+                open_ = passable(nx, ny)
+            if not open_:
+                continue
+            g_score[n] = tentative
+            came[n] = current
+            push(open_list, (tentative + estimate(nx, ny)) * stride + n)
+
+    logger.debug("_find_path_multi failed from %s after %d", start, explored)
+    return []
+
+
+# gmap -> (map version, origin -> nearest passable tile)
+_NEAREST_PASSABLE: "weakref.WeakKeyDictionary[GameMap, Tuple[int, Dict]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def nearest_passable(
+    origin: Tuple[int, int], gmap: GameMap, *, search_limit: int = SEARCH_LIMIT
+) -> Tuple[int, int]:
+    """Return the closest passable tile to ``origin``.
+
+    Results are memoised per map and dropped whenever ``gmap.version``
+    changes.  ``origin`` itself is returned if the search gives up.
+    """
+    cached = _NEAREST_PASSABLE.get(gmap)
+    if cached is None or cached[0] != gmap.version:
+        cached = (gmap.version, {})
+        _NEAREST_PASSABLE[gmap] = cached
+    results = cached[1]
+    if origin in results:
+        return results[origin]
+
+    result = origin
+    q = deque([origin])
+    visited = {origin}
+    searched = 0
+    width, height = gmap.width, gmap.height
+    while q and searched < search_limit:
+        x, y = q.popleft()
+        searched += 1
+        if gmap.passable(x, y):
+            result = (x, y)
+            break
+        for dx, dy in _OFFSETS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height and (nx, ny) not in visited:
+                visited.add((nx, ny))
+                q.append((nx, ny))
+    else:
+        logger.debug("nearest_passable hit search limit from %s", origin)
+    results[origin] = result
+    return result
+
+
+def _trace(
+    came: Dict[Tuple[int, int], Optional[Tuple[int, int]]], pos: Tuple[int, int]
+) -> List[Tuple[int, int]]:
+    """Follow breadth-first parent pointers from ``pos`` back to the start."""
+    path = [pos]
+    parent = came[pos]
+    while parent is not None:
+        path.append(parent)
+        parent = came[parent]
+    path.reverse()
+    return path
 
 
 def find_nearest_resource(
@@ -157,22 +1008,27 @@ def find_nearest_resource(
     avoid: Iterable[Tuple[int, int]] | None = None,
     spacing: int = 0,
     area: int = 10,
+    cluster_radius: int = CLUSTER_RADIUS,
 ) -> Tuple[Optional[Tuple[int, int]], List[Tuple[int, int]]]:
-    """Return the nearest tile of ``resource_type`` using BFS."""
+    """Return the nearest tile of ``resource_type``.
+
+    Cached resource clusters within ``cluster_radius`` are tried first; a
+    breadth-first search over the map is the fallback.
+    """
     if buildings is None:
         buildings = []
     if avoid is None:
         avoid = []
     avoid_set = set(avoid)
-
-    from collections import deque
+    blocked = _blocked_cells(buildings)
+    width, height = gmap.width, gmap.height
 
     if spacing > 0:
         half = area // 2
-        q = deque([(start, [start])])
-        visited = {start}
+        q = deque([start])
+        came: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start: None}
         while q:
-            pos, path = q.popleft()
+            pos = q.popleft()
             if (
                 abs(pos[0] - start[0]) > half
                 or abs(pos[1] - start[1]) > half
@@ -188,32 +1044,70 @@ def find_nearest_resource(
                     for ax, ay in avoid_set
                 )
             ):
-                return pos, path
-            for n in _neighbors(pos, gmap):
-                if n in visited or not _passable(n, gmap, buildings):
+                return pos, _trace(came, pos)
+            x, y = pos
+            for dx, dy in _ROTATED_OFFSETS[len(came) & 3]:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                n = (nx, ny)
+                if n in came or not _passable(n, gmap, blocked):
                     continue
-                visited.add(n)
-                q.append((n, path + [n]))
+                came[n] = pos
+                q.append(n)
 
-    q = deque([(start, [start])])
-    visited = {start}
+    sx, sy = start
+    candidates: List[Tuple[int, Tuple[int, int]]] = []
+    for cluster in gmap.resource_clusters(
+        resource_type,
+        sx - cluster_radius,
+        sy - cluster_radius,
+        sx + cluster_radius,
+        sy + cluster_radius,
+    ):
+        cand, lb = cluster.nearest(sx, sy, avoid_set)
+        if cand is not None:
+            candidates.append((lb, cand))
+    candidates.sort()
+    best: List[Tuple[int, int]] = []
+    for lb, cand in candidates:
+        # Manhattan distance never overestimates the step count, so no later
+        # candidate can beat a path that is already this short.
+        if best and lb >= len(best) - 1:
+            break
+        path = find_path_fast(start, cand, gmap, buildings, search_limit=search_limit)
+        if path and (not best or len(path) < len(best)):
+            best = path
+    if best:
+        return best[-1], best
+    logger.debug(
+        "find_nearest_resource found no cluster near %s for %s", start, resource_type
+    )
+
+    q = deque([start])
+    came = {start: None}
     explored = 0
 
     while q and explored < search_limit:
-        pos, path = q.popleft()
+        pos = q.popleft()
         tile = gmap.get_tile(*pos)
         if (
             tile.type is resource_type
             and tile.resource_amount > 0
             and pos not in avoid_set
         ):
-            return pos, path
+            return pos, _trace(came, pos)
         explored += 1
-        for n in _neighbors(pos, gmap):
-            if n in visited or not _passable(n, gmap, buildings):
+        x, y = pos
+        for dx, dy in _ROTATED_OFFSETS[explored & 3]:
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            n = (nx, ny)
+            if n in came or not _passable(n, gmap, blocked):
                 continue
-            visited.add(n)
-            q.append((n, path + [n]))
+            came[n] = pos
+            q.append(n)
 
     logger.debug("find_nearest_resource exhausted search from %s", start)
     return None, []
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import os
 import sys
 import time
 import logging
+from itertools import chain, groupby
 from typing import TYPE_CHECKING
 
 from .constants import Color, TileType, STATUS_PANEL_Y, Mood, UI_COLOR_RGB
-from .filters import apply_lighting, day_night_filter, zone_filter
+from .filters import (
+    apply_lighting,
+    day_night_filter,
+    pack_rgb,
+    unpack_rgb,
+    zone_filter,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +31,34 @@ except Exception:  # pragma: no cover - fallback if blessed is missing
     _HAS_BLESSED = False
 
 
+# Glyph drawn for each tile type when zoomed in (detailed) and zoomed out.
+_DETAILED_GLYPHS = {
+    TileType.GRASS: ".",
+    TileType.TREE: "t",
+    TileType.ROCK: "^",
+    TileType.WATER: "~",
+}
+_PLAIN_GLYPHS = {
+    TileType.GRASS: ".",
+    TileType.TREE: "T",
+    TileType.ROCK: "R",
+    TileType.WATER: "W",
+}
+
+
+def _brighten(color: int) -> int:
+    """Scale each channel of a packed ``0xRRGGBB`` colour by 1.3."""
+    r = min(255, ((color >> 16) & 0xFF) * 13 // 10)
+    g = min(255, ((color >> 8) & 0xFF) * 13 // 10)
+    b = min(255, (color & 0xFF) * 13 // 10)
+    return (r << 16) | (g << 8) | b
+
+
+def _no_clock() -> float:
+    """Stand-in for ``time.perf_counter`` when timings are not logged."""
+    return 0.0
+
+
 class DummyTerminal:
     """Minimal stand-in for :class:`blessed.Terminal` used in tests."""
 
@@ -30,6 +66,9 @@ class DummyTerminal:
         self.width = 80
         self.height = 24
 
+    # Erase-to-end-of-line sequence
+    clear_eol = ""
+
     def clear(self) -> str:  # pragma: no cover - simple passthrough
         return ""
 
@@ -70,6 +109,8 @@ class Renderer:
         Color.WORK_ZONE: "bold_yellow",
         Color.MARKET_ZONE: "bold_blue",
     }
+    # Cached escape sequences kept before the cache is emptied.
+    COLOR_CACHE_SIZE = 4096
 
     def __init__(self) -> None:
         if _HAS_BLESSED:
@@ -81,19 +122,40 @@ class Renderer:
             self.use_curses = False
 
         # Track previously rendered frame so we can update only changed
-        # positions. Each element mirrors the glyph/color grid passed to
-        # ``draw_grid``.
-        self._last_glyphs: list[list[str]] | None = None
-        self._last_colors: list[list[object | None]] | None = None
+        # positions. Both are the grids passed to ``draw_grid`` flattened
+        # row by row, so cell ``(x, y)`` is at ``y * width + x``.
+        self._last_glyphs: list[str] | None = None
+        self._last_colors: list[object | None] | None = None
         self._last_size: tuple[int, int] = (0, 0)
+        # Screen rows whose row lists differ from the previous frame, set by
+        # ``render_game`` for the next ``draw_grid``; ``None`` means unknown
+        self._dirty_rows: set[int] | None = None
+        # Glyph row lists of the previous frame, to find ``_dirty_rows``
+        self._frame_rows: list[list[str]] = []
+        # id(villager) -> (view, path list, its length when cached, on-screen
+        # (index, sx, sy) points) for the path overlay
+        self._path_screens: dict[int, tuple] = {}
+        # ``term.move_xy(0, y)`` for every row of the current grid size
+        self._row_moves: list[str] = []
+        # Colour -> (opening, closing) escape sequence, filled on first use so
+        # the terminal's colour helpers are only called once per colour.
+        self._color_sequences: dict[object, tuple[str, str]] = {}
+        # (detailed, is_night) -> glyph per tile type
+        self._glyph_tables: dict[tuple[bool, bool], dict[TileType, str]] = {}
+        # World row -> (inputs it was built from, glyph row, colour row) for
+        # the terrain under the overlays
+        self._row_cache: dict[int, tuple[tuple, list[str], list[object]]] = {}
+        # (tile type, zone) -> lit colour, packed as ``0xRRGGBB`` so colour
+        # runs compare as single ints, for the (hour, filters) stamp
+        self._light_cache: dict[tuple, object] = {}
+        self._light_stamp: tuple | None = None
 
     def clear(self) -> None:
         if self.use_curses:
             self.term.clear()
             self.term.refresh()
         else:
-            sys.stdout.write(self.term.clear())
-            sys.stdout.flush()
+            self._write(self.term.clear())
         # Reset diff tracking since the screen is now blank
         self._last_glyphs = None
         self._last_colors = None
@@ -115,87 +177,144 @@ class Renderer:
             self.clear()
             self._last_size = size
 
+        # Rows ``render_game`` may have changed since the previous frame
+        dirty = self._dirty_rows
+        self._dirty_rows = None
+
+        flat_glyphs = list(chain.from_iterable(glyphs))
+        flat_colors = list(chain.from_iterable(colors))
+        last_glyphs = self._last_glyphs
+        last_colors = self._last_colors
+        # Store frame for diffing next draw
+        self._last_glyphs = flat_glyphs
+        self._last_colors = flat_colors
+        if full_redraw or dirty is None:
+            if (
+                not full_redraw
+                and flat_glyphs == last_glyphs
+                and flat_colors == last_colors
+            ):
+                return
+            rows = range(height)
+        else:
+            rows = sorted(y for y in dirty if y < height)
+
         if self.use_curses:
-            for y, row in enumerate(glyphs):
-                for x, ch in enumerate(row):
+            for y in rows:
+                for i in range(y * width, y * width + width):
+                    ch = flat_glyphs[i]
                     if (
                         full_redraw
-                        or self._last_glyphs[y][x] != ch
-                        or self._last_colors[y][x] != colors[y][x]
+                        or last_glyphs[i] != ch
+                        or last_colors[i] != flat_colors[i]
                     ):
-                        self.term.addstr(y, x, ch)
+                        self.term.addstr(y, i - y * width, ch)
             self.term.refresh()
         else:
 
-            def apply_color(text: str, color: object | None) -> str:
-                if color is None:
-                    return text
-                if isinstance(color, tuple):
-                    if hasattr(self.term, "color_rgb"):
-                        return self.term.color_rgb(*color) + text
-                    return text
-                if color is Color.UI:
-                    if hasattr(self.term, "color_rgb"):
-                        return self.term.color_rgb(*self.UI_RGB) + text
-                    return text
-                attr = self.COLOR_ATTRS.get(color)
-                if attr and hasattr(self.term, attr):
-                    return getattr(self.term, attr)(text)
-                return text
+            sequences = self._color_sequences
+            if len(sequences) > self.COLOR_CACHE_SIZE:
+                # Lit colours drift with the time of day; drop stale ones.
+                sequences.clear()
+            # Resolve the frame's colours up front so the row loop below is
+            # plain dict lookups
+            for y in rows:
+                for color in set(colors[y]):
+                    if color not in sequences:
+                        sequences[color] = self._escape_for(color)
+
+            if full_redraw:
+                # Cursor moves to the start of each row; the grid size only
+                # changes on a full redraw.
+                self._row_moves = [self.term.move_xy(0, y) for y in range(height)]
+            row_moves = self._row_moves
 
             out: list[str] = []
-            for y, row in enumerate(glyphs):
+            for y in rows:
+                row = glyphs[y]
                 color_row = colors[y]
-                if not full_redraw and self._last_glyphs is not None:
+                if not full_redraw:
+                    start = y * width
+                    end = start + width
                     if (
-                        row == self._last_glyphs[y]
-                        and color_row == self._last_colors[y]
+                        row == last_glyphs[start:end]
+                        and color_row == last_colors[start:end]
                     ):
                         continue
 
-                segments: list[str] = []
+                segments: list[str] = [row_moves[y]]
+                # groupby finds the runs of equal colour in C; only the
+                # handful of runs per row reach this loop
                 start = 0
-                current_color = color_row[0]
-                for x, color in enumerate(color_row):
-                    if color != current_color:
-                        segment = "".join(row[start:x])
-                        segments.append(apply_color(segment, current_color))
-                        start = x
-                        current_color = color
-                segment = "".join(row[start:])
-                segments.append(apply_color(segment, current_color))
-                out.append(self.term.move_xy(0, y) + "".join(segments))
-
-            sys.stdout.write("".join(out))
-            sys.stdout.flush()
-
-        # Store frame for diffing next draw
-        self._last_glyphs = [row.copy() for row in glyphs]
-        self._last_colors = [row.copy() for row in colors]
+                for color, run in groupby(color_row):
+                    end = start + len(list(run))
+                    opening, closing = sequences[color]
+                    segments += (opening, "".join(row[start:end]), closing)
+                    start = end
+                out.append("".join(segments))
+
+            if out:
+                self._write("".join(out))
+
+    def _write(self, text: str) -> None:
+        """Send ``text`` to the terminal, bypassing the text layer if possible.
+
+        A real terminal gets the encoded frame in ``os.write`` calls on its
+        file descriptor; streams without one (tests, captured output) fall
+        back to ``write``.
+        """
+        stream = sys.stdout
+        try:
+            fd = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            stream.write(text)
+            stream.flush()
+            return
+        # Keep anything already buffered ahead of the frame
+        stream.flush()
+        encoding = getattr(stream, "encoding", None) or "utf-8"
+        errors = getattr(stream, "errors", None) or "strict"
+        data = memoryview(text.encode(encoding, errors))
+        while data:
+            data = data[os.write(fd, data) :]
+
+    def _escape_for(self, color: object) -> tuple[str, str]:
+        """Return the escape sequences that open and close ``color``."""
+        if color is None:
+            return "", ""
+        if isinstance(color, (int, tuple)) or color is Color.UI:
+            if not hasattr(self.term, "color_rgb"):
+                return "", ""
+            if color is Color.UI:
+                rgb = self.UI_RGB
+            elif isinstance(color, int):
+                rgb = unpack_rgb(color)
+            else:
+                rgb = color
+            return self.term.color_rgb(*rgb), ""
+        attr = self.COLOR_ATTRS.get(color)
+        if attr and hasattr(self.term, attr):
+            # Format a placeholder once and keep what surrounds it.
+            opening, _, closing = getattr(self.term, attr)("\0").partition("\0")
+            return opening, closing
+        return "", ""
+
+    def _glyph_table(self, detailed: bool, is_night: bool) -> dict[TileType, str]:
+        """Return the glyph drawn for each tile type in the given mode."""
+        key = (detailed, is_night)
+        table = self._glyph_tables.get(key)
+        if table is None:
+            table = {}
+            for tile_type in TileType:
+                glyph = self._tile_to_render(tile_type, detailed)
+                table[tile_type] = glyph.lower() if is_night else glyph
+            self._glyph_tables[key] = table
+        return table
 
     # ------------------------------------------------------------------
     def _tile_to_render(self, tile: TileType, detailed: bool) -> str:
         """Return a glyph for the given tile type."""
-        if detailed:
-            if tile is TileType.GRASS:
-                glyph = "."
-            elif tile is TileType.TREE:
-                glyph = "t"
-            elif tile is TileType.ROCK:
-                glyph = "^"
-            else:
-                glyph = "~"
-        else:
-            if tile is TileType.GRASS:
-                glyph = "."
-            elif tile is TileType.TREE:
-                glyph = "T"
-            elif tile is TileType.ROCK:
-                glyph = "R"
-            else:
-                glyph = "W"
-
-        return glyph
+        return (_DETAILED_GLYPHS if detailed else _PLAIN_GLYPHS)[tile]
 
     def render_game(
         self,
@@ -219,7 +338,10 @@ class Renderer:
         if reserved is None:
             reserved = set()
 
-        start_total = time.perf_counter()
+        # Section timings are only taken when they will be logged
+        debug = logger.isEnabledFor(logging.DEBUG)
+        now = time.perf_counter if debug else _no_clock
+        start_total = now()
         lighting_time = 0.0
         base_time = 0.0
         building_time = 0.0
@@ -230,113 +352,198 @@ class Renderer:
         glyph_grid: list[list[str]] = []
         color_grid: list[list[object]] = []
 
-        t0 = time.perf_counter()
+        zoom = camera.zoom
+        glyph_for = self._glyph_table(detailed, is_night)
+        x0 = camera.x
+        visible_x = camera.visible_tiles_x
+        # Reserved cells in view, by row
+        reserved_rows: dict[int, list[int]] = {}
+        for rx, ry in reserved:
+            if x0 <= rx < x0 + visible_x:
+                reserved_rows.setdefault(ry, []).append(rx)
+        # Lit colours only change with the hour and the filter chain
+        light_stamp = (int(day_fraction * 24), tuple(filters))
+        # Everything besides the row itself that decides its base glyphs and
+        # colours
+        frame_key = (
+            x0,
+            visible_x,
+            zoom,
+            detailed,
+            is_night,
+            light_stamp,
+            gmap.version,
+            gmap.zone_version,
+        )
+        if self._light_stamp != light_stamp:
+            self._light_stamp = light_stamp
+            self._light_cache = {}
+        lit = self._light_cache
+        row_cache = self._row_cache
+        if len(row_cache) > 4 * camera.visible_tiles_y:
+            row_cache.clear()
+
+        t0 = now()
         for ty in range(camera.visible_tiles_y):
-            glyph_row: list[str] = []
-            color_row: list[object] = []
-            for tx in range(camera.visible_tiles_x):
-                wx = camera.x + tx
-                wy = camera.y + ty
-                tile = gmap.get_tile(wx, wy)
-                glyph = self._tile_to_render(tile.type, detailed)
-                t0 = time.perf_counter()
-                color = apply_lighting(tile, day_fraction, filters)
-                if (wx, wy) in reserved:
-                    color = tuple(min(255, int(c * 1.3)) for c in color)
-                lighting_time += time.perf_counter() - t0
-                if is_night:
-                    glyph = glyph.lower()
-
-                glyph_row.extend([glyph] * camera.zoom)
-                color_row.extend([color] * camera.zoom)
-            for _ in range(camera.zoom):
-                glyph_grid.append(glyph_row.copy())
-                color_grid.append(color_row.copy())
-        base_time = time.perf_counter() - t0
-
-        t0 = time.perf_counter()
-        # Overlay buildings
+            wy = camera.y + ty
+            row_key = (frame_key, tuple(sorted(reserved_rows.get(wy, ()))))
+            cached = row_cache.get(wy)
+            if cached is not None and cached[0] == row_key:
+                _, glyph_row, color_row = cached
+            else:
+                glyph_row = []
+                color_row = []
+                for tx in range(visible_x):
+                    wx = x0 + tx
+                    tile = gmap.get_tile(wx, wy)
+                    glyph = glyph_for[tile.type]
+                    light_key = (tile.type, tile.zone)
+                    color = lit.get(light_key)
+                    if color is None:
+                        t1 = now()
+                        color = pack_rgb(apply_lighting(tile, day_fraction, filters))
+                        lit[light_key] = color
+                        lighting_time += now() - t1
+                    if (wx, wy) in reserved:
+                        color = _brighten(color)
+
+                    if zoom == 1:
+                        glyph_row.append(glyph)
+                        color_row.append(color)
+                    else:
+                        glyph_row.extend([glyph] * zoom)
+                        color_row.extend([color] * zoom)
+                row_cache[wy] = (row_key, glyph_row, color_row)
+            # Screen rows share the cached lists until an overlay writes to
+            # them; see ``put`` below.
+            for _ in range(zoom):
+                glyph_grid.append(glyph_row)
+                color_grid.append(color_row)
+        base_time = now() - t0
+        grid_h = len(glyph_grid)
+        grid_w = len(glyph_grid[0]) if grid_h else 0
+        # Screen rows already copied out of the row cache this frame
+        owned: set[int] = set()
+
+        def put(sx: int, sy: int, glyph: str, color: object) -> None:
+            if sy not in owned:
+                glyph_grid[sy] = glyph_grid[sy].copy()
+                color_grid[sy] = color_grid[sy].copy()
+                owned.add(sy)
+            glyph_grid[sy][sx] = glyph
+            color_grid[sy][sx] = color
+
+        t0 = now()
+        # Completed road positions, so each road picks its orientation from
+        # set lookups rather than scanning every building.
+        road_cells = {
+            cell
+            for nb in buildings
+            if nb.blueprint.name == "Road" and getattr(nb, "complete", False)
+            for cell in nb.cells()
+        }
+        # Overlay buildings: gather the footprint cells inside the view in
+        # world coordinates, then translate and write only those, resolving
+        # each building's glyph once rather than per cell.
+        y0 = camera.y
+        visible_y = camera.visible_tiles_y
         for b in buildings:
+            cells = getattr(b, "cells", lambda: [(b.position[0], b.position[1])])()
+            cells = [
+                (bx, by)
+                for bx, by in cells
+                if 0 <= bx - x0 < visible_x and 0 <= by - y0 < visible_y
+            ]
+            if not cells:
+                continue
             render_fn = getattr(b, "glyph_for_progress", None)
-            for bx, by in getattr(
-                b, "cells", lambda: [(b.position[0], b.position[1])]
-            )():
-                sx, sy = camera.world_to_screen(bx, by)
-                if 0 <= sy < len(glyph_grid) and 0 <= sx < len(glyph_grid[0]):
-                    if callable(render_fn):
-                        glyph, color = render_fn()
+            if callable(render_fn):
+                glyph, color = render_fn()
+            else:
+                glyph, color = b.blueprint.glyph, b.blueprint.color
+            is_road = b.blueprint.name == "Road" and getattr(b, "complete", False)
+            screen = camera.world_to_screen_batch(cells)
+            for (bx, by), (sx, sy) in zip(cells, screen):
+                if is_road:
+                    n = (bx, by - 1) in road_cells
+                    s = (bx, by + 1) in road_cells
+                    w = (bx - 1, by) in road_cells
+                    e = (bx + 1, by) in road_cells
+                    if (n or s) and not (w or e):
+                        glyph = "|"
+                    elif (w or e) and not (n or s):
+                        glyph = "-"
                     else:
-                        glyph, color = b.blueprint.glyph, b.blueprint.color
-
-                    if b.blueprint.name == "Road" and getattr(b, "complete", False):
-                        n = any(
-                            nb.position == (bx, by - 1)
-                            and nb.blueprint.name == "Road"
-                            and nb.complete
-                            for nb in buildings
-                        )
-                        s = any(
-                            nb.position == (bx, by + 1)
-                            and nb.blueprint.name == "Road"
-                            and nb.complete
-                            for nb in buildings
-                        )
-                        w = any(
-                            nb.position == (bx - 1, by)
-                            and nb.blueprint.name == "Road"
-                            and nb.complete
-                            for nb in buildings
-                        )
-                        e = any(
-                            nb.position == (bx + 1, by)
-                            and nb.blueprint.name == "Road"
-                            and nb.complete
-                            for nb in buildings
-                        )
-                        if (n or s) and not (w or e):
-                            glyph = "|"
-                        elif (w or e) and not (n or s):
-                            glyph = "-"
-                        else:
-                            glyph = "+"
-
-                    glyph_grid[sy][sx] = glyph
-                    color_grid[sy][sx] = color
-        building_time = time.perf_counter() - t0
-
-        t0 = time.perf_counter()
-        # Overlay villager paths first so the villager glyphs appear on top
+                        glyph = "+"
+                put(sx, sy, glyph, color)
+        building_time = now() - t0
+
+        t0 = now()
+        # Overlay villager paths first so the villager glyphs appear on top.
+        # Villagers consume their path from the front, so the on-screen
+        # points of a path are kept until it is replaced or the view moves.
+        view = (camera.x, camera.y, zoom, grid_w, grid_h)
+        old_paths = self._path_screens
+        path_screens: dict[int, tuple] = {}
         for vill in villagers:
             path = getattr(vill, "target_path", [])
-            for px, py in path[:-1]:
-                sx, sy = camera.world_to_screen(px, py)
-                if 0 <= sy < len(glyph_grid) and 0 <= sx < len(glyph_grid[0]):
-                    glyph_grid[sy][sx] = "\xb7"  # middle dot character
-                    color_grid[sy][sx] = Color.PATH
-        path_time = time.perf_counter() - t0
-
-        t0 = time.perf_counter()
+            if len(path) < 2:
+                continue
+            entry = old_paths.get(id(vill))
+            if (
+                entry is None
+                or entry[0] != view
+                or entry[1] is not path
+                or len(path) > entry[2]
+            ):
+                on_screen = [
+                    (i, sx, sy)
+                    for i, (sx, sy) in enumerate(camera.world_to_screen_batch(path))
+                    if 0 <= sy < grid_h and 0 <= sx < grid_w
+                ]
+                entry = (view, path, len(path), on_screen)
+            path_screens[id(vill)] = entry
+            # Index range of the full path still ahead, minus the goal cell
+            first, last = entry[2] - len(path), entry[2] - 1
+            for i, sx, sy in entry[3]:
+                if first <= i < last:
+                    put(sx, sy, "\xb7", Color.PATH)  # middle dot character
+        self._path_screens = path_screens
+        path_time = now() - t0
+
+        t0 = now()
         # Overlay villagers
-        for vill in villagers:
-            sx, sy = camera.world_to_screen(vill.x, vill.y)
-            if 0 <= sy < len(glyph_grid) and 0 <= sx < len(glyph_grid[0]):
-                glyph_grid[sy][sx] = "z" if getattr(vill, "asleep", False) else "@"
-                color_grid[sy][sx] = Color.UI
+        screen = camera.world_to_screen_batch([(v.x, v.y) for v in villagers])
+        for vill, (sx, sy) in zip(villagers, screen):
+            if 0 <= sy < grid_h and 0 <= sx < grid_w:
+                put(sx, sy, "z" if getattr(vill, "asleep", False) else "@", Color.UI)
                 mood_char = {
                     Mood.HAPPY: "^",
                     Mood.NEUTRAL: "~",
                     Mood.SAD: "v",
                 }.get(vill.mood, "~")
-                if sx + 1 < len(glyph_grid[0]):
-                    glyph_grid[sy][sx + 1] = mood_char
-                    color_grid[sy][sx + 1] = Color.UI
-        villager_time = time.perf_counter() - t0
+                if sx + 1 < grid_w:
+                    put(sx + 1, sy, mood_char, Color.UI)
+        villager_time = now() - t0
+
+        # Cached rows are never modified and overlays copy before writing,
+        # so a screen row holding the same list as last frame is unchanged.
+        previous = self._frame_rows
+        if len(previous) == grid_h:
+            self._dirty_rows = {
+                sy for sy in range(grid_h) if glyph_grid[sy] is not previous[sy]
+            }
+        else:
+            self._dirty_rows = None
+        self._frame_rows = list(glyph_grid)
 
-        t0 = time.perf_counter()
+        t0 = now()
         self.draw_grid(glyph_grid, color_grid)
-        draw_time = time.perf_counter() - t0
+        draw_time = now() - t0
 
-        total_time = (time.perf_counter() - start_total) * 1000
+        if not debug:
+            return
+        total_time = (now() - start_total) * 1000
         logger.debug(
             "render_game took %.2f ms (tiles %.2f ms, buildings %.2f ms, paths %.2f ms,"
             " villagers %.2f ms, draw %.2f ms, lighting %.2f ms)",
@@ -356,10 +563,11 @@ class Renderer:
         else:
             width = self.term.width
 
-        line = text.ljust(width)
+        line = text[:width]
 
         if self.use_curses:
-            self.term.addstr(STATUS_PANEL_Y, 0, line[:width])
+            self.term.addstr(STATUS_PANEL_Y, 0, line)
+            self.term.clrtoeol()
             self.term.refresh()
         else:
             prefix = (
@@ -367,7 +575,12 @@ class Renderer:
                 if hasattr(self.term, "color_rgb")
                 else ""
             )
-            sys.stdout.write(self.term.move_xy(0, STATUS_PANEL_Y) + prefix + line)
+            sys.stdout.write(
+                self.term.move_xy(0, STATUS_PANEL_Y)
+                + prefix
+                + line
+                + self.term.clear_eol
+            )
             sys.stdout.flush()
 
     def render_help(self, lines: list[str], start_y: int = 0) -> None:
@@ -379,16 +592,19 @@ class Renderer:
 
         for idx, line in enumerate(lines):
             y = start_y + idx
-            line = line.ljust(width)
+            line = line[:width]
             if self.use_curses:
-                self.term.addstr(y, 0, line[:width])
+                self.term.addstr(y, 0, line)
+                self.term.clrtoeol()
             else:
                 prefix = (
                     self.term.color_rgb(*self.UI_RGB)
                     if hasattr(self.term, "color_rgb")
                     else ""
                 )
-                sys.stdout.write(self.term.move_xy(0, y) + prefix + line)
+                sys.stdout.write(
+                    self.term.move_xy(0, y) + prefix + line + self.term.clear_eol
+                )
         if self.use_curses:
             self.term.refresh()
         else:
@@ -403,16 +619,19 @@ class Renderer:
 
         for idx, line in enumerate(lines):
             y = start_y + idx
-            line = line.ljust(width)
+            line = line[:width]
             if self.use_curses:
-                self.term.addstr(y, 0, line[:width])
+                self.term.addstr(y, 0, line)
+                self.term.clrtoeol()
             else:
                 prefix = (
                     self.term.color_rgb(*self.UI_RGB)
                     if hasattr(self.term, "color_rgb")
                     else ""
                 )
-                sys.stdout.write(self.term.move_xy(0, y) + prefix + line)
+                sys.stdout.write(
+                    self.term.move_xy(0, y) + prefix + line + self.term.clear_eol
+                )
         if self.use_curses:
             self.term.refresh()
         else:
@@ -3,10 +3,67 @@ from __future__ import annotations
 import random
 import time
 
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 from .constants import MAP_WIDTH, MAP_HEIGHT, TileType
 
+_U32 = 0xFFFFFFFF
+# Lattice cells whose corner hashes are kept before the memo is emptied
+_CORNER_CACHE_SIZE = 1 << 16
+
+# Preview glyph per tile type
+_PREVIEW_GLYPHS = {
+    TileType.WATER: "~",
+    TileType.ROCK: "^",
+    TileType.TREE: "T",
+    TileType.GRASS: ".",
+}
+
+
+def _hash01(x: int, y: int, seed: int) -> float:
+    """Map lattice coordinates to a float in ``[0, 1)``.
+
+    Closed-form 32-bit integer mix (two multiply rounds, so neighbouring
+    lattice points decorrelate); no generator object per sample.
+    """
+    h = ((x * 92837111) ^ (y * 689287499) ^ seed) & _U32
+    h = ((h ^ (h >> 16)) * 0x7FEB352D) & _U32
+    h = ((h ^ (h >> 15)) * 0x846CA68B) & _U32
+    h ^= h >> 16
+    return (h & 0xFFFFFF) / 16777216.0
+
+
+def _value_noise(
+    x: int,
+    y: int,
+    scale: int,
+    seed: int,
+    corners: Dict[int, Tuple[float, float, float, float]],
+) -> float:
+    """Bilinearly blended lattice noise at ``x,y``.
+
+    The four corner hashes of each lattice cell are kept in ``corners``;
+    every tile inside the cell shares them.
+    """
+    x0, rx = divmod(x, scale)
+    y0, ry = divmod(y, scale)
+    fx = rx / scale
+    key = ((y0 << 24) | x0) << 8 | scale
+    cell = corners.get(key)
+    if cell is None:
+        if len(corners) >= _CORNER_CACHE_SIZE:
+            corners.clear()
+        cell = corners[key] = (
+            _hash01(x0, y0, seed),
+            _hash01(x0 + 1, y0, seed),
+            _hash01(x0, y0 + 1, seed),
+            _hash01(x0 + 1, y0 + 1, seed),
+        )
+    n00, n10, n01, n11 = cell
+    top = n00 + (n10 - n00) * fx
+    bottom = n01 + (n11 - n01) * fx
+    return top + (bottom - top) * (ry / scale)
+
 
 class TerrainGenerator:
     """Generate biomes and resource clusters using layered noise."""
@@ -18,6 +75,8 @@ class TerrainGenerator:
         self.height = height
         self.seed = seed
         self._rand = random.Random(seed)
+        # Packed (lattice y, lattice x, scale) -> corner hashes
+        self._corners: Dict[int, Tuple[float, float, float, float]] = {}
         self.precomputed_clusters: Dict[TileType, List[Tuple[int, int]]] = {
             TileType.TREE: [],
             TileType.ROCK: [],
@@ -26,49 +85,45 @@ class TerrainGenerator:
         self._init_clusters()
 
     # --- Noise helpers -------------------------------------------------
-    def _hash(self, x: int, y: int) -> float:
-        return random.Random((x * 92837111) ^ (y * 689287499) ^ self.seed).random()
-
-    def _lerp(self, a: float, b: float, t: float) -> float:
-        return a + (b - a) * t
-
     def _value_noise(self, x: int, y: int, scale: int = 50) -> float:
-        x0 = x // scale
-        y0 = y // scale
-        fx = (x % scale) / scale
-        fy = (y % scale) / scale
-        n00 = self._hash(x0, y0)
-        n10 = self._hash(x0 + 1, y0)
-        n01 = self._hash(x0, y0 + 1)
-        n11 = self._hash(x0 + 1, y0 + 1)
-        nx0 = self._lerp(n00, n10, fx)
-        nx1 = self._lerp(n01, n11, fx)
-        return self._lerp(nx0, nx1, fy)
+        return _value_noise(x, y, scale, self.seed, self._corners)
 
     def _is_river(self, x: int, y: int) -> bool:
         """Return True if coordinates fall on a river."""
         # Use stretched noise to create elongated river shapes.
-        n = self._value_noise(x // 4, y, scale=30)
+        n = _value_noise(x // 4, y, 30, self.seed, self._corners)
         return n < 0.05
 
     # --- Public API ----------------------------------------------------
     def tile_at(self, x: int, y: int) -> Tuple[TileType, int, bool]:
-        """Return terrain at ``x,y``."""
+        """Return terrain at ``x,y``.
+
+        The noise layers are evaluated through module-level functions and
+        only as far as the result needs: rivers short-circuit everything,
+        and the rock layer is skipped unless the elevation allows rock.
+        """
         if self._is_river(x, y):
             return TileType.WATER, 0, False
 
-        elevation = self._value_noise(x, y, scale=80)
-        rock_chance = self._value_noise(x + 3000, y + 3000, scale=5)
-        forest_chance = self._value_noise(x + 1000, y + 1000, scale=15)
-
-        if elevation > 0.75 and rock_chance > 0.5:
+        seed = self.seed
+        corners = self._corners
+        if (
+            _value_noise(x, y, 80, seed, corners) > 0.75
+            and _value_noise(x + 3000, y + 3000, 5, seed, corners) > 0.5
+        ):
             return TileType.ROCK, 100, True
-        if forest_chance > 0.6:
-            amt = 100 if self._hash(x + 1, y + 1) > 0.1 else 0
-
+        if _value_noise(x + 1000, y + 1000, 15, seed, corners) > 0.6:
+            amt = 100 if _hash01(x + 1, y + 1, seed) > 0.1 else 0
             return TileType.TREE, amt, True
         return TileType.GRASS, 0, True
 
+    def tile_at_batch(
+        self, xs: Iterable[int], ys: Iterable[int]
+    ) -> List[Tuple[TileType, int, bool]]:
+        """Return :meth:`tile_at` for every ``(x, y)`` pair of ``xs``/``ys``."""
+        tile_at = self.tile_at
+        return [tile_at(x, y) for x, y in zip(xs, ys)]
+
     def _init_clusters(self) -> None:
         """Populate ``precomputed_clusters`` with random centres."""
 
@@ -82,44 +137,19 @@ class TerrainGenerator:
 
     def preview(self, scale: int = 1000) -> List[str]:
         """Return a coarse preview of the map."""
-        rows: List[str] = []
-        for y in range(0, self.height, scale):
-            row = []
-            for x in range(0, self.width, scale):
-                t, _, _ = self.tile_at(x, y)
-                if t is TileType.WATER:
-                    row.append("~")
-                elif t is TileType.ROCK:
-                    row.append("^")
-                elif t is TileType.TREE:
-                    row.append("T")
-                else:
-                    row.append(".")
-            rows.append("".join(row))
-        return rows
-
-
-    def preview_stream(self, scale: int = 1000):
+        return list(self.preview_stream(scale))
+
+    def preview_stream(self, scale: int = 1000) -> Iterator[str]:
         """Yield preview rows one by one."""
+        xs = range(0, self.width, scale)
         for y in range(0, self.height, scale):
-            row = []
-            for x in range(0, self.width, scale):
-                t, _, _ = self.tile_at(x, y)
-                if t is TileType.WATER:
-                    row.append("~")
-                elif t is TileType.ROCK:
-                    row.append("^")
-                elif t is TileType.TREE:
-                    row.append("T")
-                else:
-                    row.append(".")
-            yield "".join(row)
+            tiles = self.tile_at_batch(xs, [y] * len(xs))
+            yield "".join([_PREVIEW_GLYPHS[t] for t, _, _ in tiles])
 
     def display_preview(self, scale: int = 1000, delay: float = 0.02) -> None:
         """Print a preview of the world with a simple progress bar."""
-        rows = list(self.preview_stream(scale))
-        total = len(rows)
-        for i, row in enumerate(rows, 1):
+        total = (self.height + scale - 1) // scale
+        for i, row in enumerate(self.preview_stream(scale), 1):
             print(row)
             percent = i * 100 // total
             bar = "#" * (percent // 5)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from .constants import TileType, ZoneType
 
 
-@dataclass
+@dataclass(slots=True)
 class Tile:
     """Represents a single map tile."""
 
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import random
 import logging
+from collections import deque
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from itertools import islice, permutations, product
+from typing import TYPE_CHECKING, AbstractSet, Deque, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:  # pragma: no cover - imports for type hints only
     from .game import Game
 
 from .building import Building
+from .job import Job
 from .constants import (
     CARRY_CAPACITY,
     Mood,
@@ -20,12 +23,52 @@ from .constants import (
 )
 from .pathfinding import (
     find_nearest_resource,
-    find_path_fast,
     find_path_to_building_adjacent,
 )
 
 logger = logging.getLogger(__name__)
 
+# Action delay multipliers; anything not listed acts at normal speed
+_PERSONALITY_DELAY = {Personality.LAZY: 1.2, Personality.INDUSTRIOUS: 0.8}
+_MOOD_DELAY = {Mood.HAPPY: 0.9, Mood.SAD: 1.1}
+_LIFE_STAGE_DELAY = {
+    LifeStage.CHILD: 1.5,
+    LifeStage.ELDER: 1.2,
+    LifeStage.RETIRED: 2.0,
+}
+# (personality, mood, life stage) -> combined action delay multiplier
+_TRAIT_DELAY = {
+    (personality, mood, stage): _PERSONALITY_DELAY.get(personality, 1.0)
+    * _MOOD_DELAY.get(mood, 1.0)
+    * _LIFE_STAGE_DELAY.get(stage, 1.0)
+    for personality, mood, stage in product(Personality, Mood, LifeStage)
+}
+# Jitter applied to action delays.  Industrious/happy villagers tend to be more
+# consistent, while lazy/sad villagers vary more.
+_JITTER_SCALE = {
+    Personality.INDUSTRIOUS: 0.8,
+    Personality.LAZY: 1.2,
+    Mood.HAPPY: 0.8,
+    Mood.SAD: 1.2,
+}
+
+
+def _jitter_bounds(personality: Personality, mood: Mood) -> Tuple[float, float]:
+    variation = 0.1 * _JITTER_SCALE.get(personality, 1.0) * _JITTER_SCALE.get(mood, 1.0)
+    return 1 - variation, 1 + variation
+
+
+# (personality, mood) -> bounds passed to ``random.uniform``
+_DELAY_JITTER = {
+    (personality, mood): _jitter_bounds(personality, mood)
+    for personality, mood in product(Personality, Mood)
+}
+# Every order of the four neighbouring steps; wandering picks one at random
+_STEP_ORDERS = tuple(permutations(((1, 0), (-1, 0), (0, 1), (0, -1))))
+# Moods from worst to best, and each mood's place in that order
+_MOOD_LEVELS = (Mood.SAD, Mood.NEUTRAL, Mood.HAPPY)
+_MOOD_RANK = {mood: i for i, mood in enumerate(_MOOD_LEVELS)}
+
 
 @dataclass
 class Villager:
@@ -34,9 +77,12 @@ class Villager:
     id: int
     position: Tuple[int, int]
     state: str = "idle"
-    inventory: Dict[str, int] = field(default_factory=lambda: {"wood": 0, "stone": 0})
+    # Resources being carried
+    wood: int = 0
+    stone: int = 0
     carrying_capacity: int = CARRY_CAPACITY
-    target_path: List[Tuple[int, int]] = field(default_factory=list)
+    # Tiles still to walk, consumed from the left as the villager steps
+    target_path: Deque[Tuple[int, int]] = field(default_factory=deque)
     target_resource: Optional[Tuple[int, int]] = None
     resource_type: Optional[TileType] = None
     target_building: Optional[Building] = None
@@ -52,80 +98,46 @@ class Villager:
     life_stage: LifeStage = LifeStage.ADULT
     role: Role = Role.LABOURER
     reservations: Dict[TileType, Tuple[int, int] | None] = field(default_factory=dict)
+    # Job offering help with ``target_building``, re-queued while building
+    _build_job: Job | None = field(default=None, init=False, repr=False, compare=False)
 
     # ---------------------------------------------------------------
+    @property
+    def inventory(self) -> Dict[str, int]:
+        """Resources carried, by name."""
+        return {"wood": self.wood, "stone": self.stone}
+
     def is_full(self) -> bool:
-        return sum(self.inventory.values()) >= self.carrying_capacity
+        return self.wood + self.stone >= self.carrying_capacity
 
     def _apply_tool_bonus(self, game: "Game", delay: int) -> int:
-        for b in game.buildings:
-            if b.blueprint.name == "Blacksmith" and b.complete:
-                bx, by = b.position
-                if abs(bx - self.position[0]) <= 5 and abs(by - self.position[1]) <= 5:
-                    return max(0, delay // 2)
+        if game.completed_near("Blacksmith", self.position, 5) is not None:
+            return max(0, delay // 2)
         return delay
 
-    def _personality_delay_factor(self) -> float:
-        if self.personality is Personality.LAZY:
-            return 1.2
-        if self.personality is Personality.INDUSTRIOUS:
-            return 0.8
-        return 1.0
-
-    def _mood_delay_factor(self) -> float:
-        if self.mood is Mood.HAPPY:
-            return 0.9
-        if self.mood is Mood.SAD:
-            return 1.1
-        return 1.0
-
-    def _life_stage_delay_factor(self) -> float:
-        if self.life_stage is LifeStage.CHILD:
-            return 1.5
-        if self.life_stage is LifeStage.ELDER:
-            return 1.2
-        if self.life_stage is LifeStage.RETIRED:
-            return 2.0
-        return 1.0
-
-    def _time_of_day_delay_factor(self, game: "Game") -> float:
-        """Return slowdown factor for night time."""
-        return 1.5 if game.world.is_night else 1.0
-
     def _action_delay(self, game: "Game", base_delay: int) -> int:
         delay = self._apply_tool_bonus(game, base_delay)
-        delay = int(
-            delay
-            * self._personality_delay_factor()
-            * self._mood_delay_factor()
-            * self._life_stage_delay_factor()
-            * self._time_of_day_delay_factor(game)
-        )
+        factor = _TRAIT_DELAY[self.personality, self.mood, self.life_stage]
+        # Villagers are slower at night
+        delay = int(delay * factor * (1.5 if game.world.is_night else 1.0))
 
         # Introduce a small random variation so actions don't all complete at
         # exactly the same intervals.  Personalities and mood influence how
-        # large the jitter can be.  Industrious/happy villagers tend to be more
-        # consistent, while lazy/sad villagers vary more.
-        variation = 0.1
-        if self.personality is Personality.INDUSTRIOUS:
-            variation *= 0.8
-        elif self.personality is Personality.LAZY:
-            variation *= 1.2
-        if self.mood is Mood.HAPPY:
-            variation *= 0.8
-        elif self.mood is Mood.SAD:
-            variation *= 1.2
-        delay = int(delay * random.uniform(1 - variation, 1 + variation))
+        # large the jitter can be.
+        low, high = _DELAY_JITTER[self.personality, self.mood]
+        delay = int(delay * random.uniform(low, high))
 
         return max(0, delay)
 
     def adjust_mood(self, delta: int) -> None:
-        levels = [Mood.SAD, Mood.NEUTRAL, Mood.HAPPY]
-        idx = levels.index(self.mood)
-        idx = max(0, min(len(levels) - 1, idx + delta))
-        self.mood = levels[idx]
+        idx = _MOOD_RANK[self.mood] + delta
+        self.mood = _MOOD_LEVELS[max(0, min(len(_MOOD_LEVELS) - 1, idx))]
 
     # ------------------------------------------------------------------
+    def _follow(self, path: List[Tuple[int, int]]) -> None:
+        """Walk ``path``, skipping its first tile: the one already occupied."""
+        self.target_path = deque(islice(path, 1, None))
+
     def _move_away_from(self, other: Tuple[int, int], game: "Game") -> bool:
         """Step one tile away from ``other`` if possible."""
 
@@ -139,26 +151,33 @@ class Villager:
             step_y = self.position[1] + (1 if dy > 0 else -1)
             options.append((self.position[0], step_y))
         random.shuffle(options)
-        for nx, ny in options:
-            if not (0 <= nx < game.map.width and 0 <= ny < game.map.height):
-                continue
-            tile = game.map.get_tile(nx, ny)
-            if not tile.passable:
-                continue
-            if any(v.position == (nx, ny) for v in game.entities if v is not self):
-                continue
-            blocked = False
-            for b in game.buildings:
-                cells = b.cells() if hasattr(b, "cells") else [b.position]
-                if (nx, ny) in cells and not b.passable:
-                    blocked = True
-                    break
-            if blocked:
-                continue
-            self.target_path = [(nx, ny)]
-            return self._move_step(game)
+        blocked = game.building_index.blocked()
+        for pos in options:
+            if self._is_free(game, pos, blocked):
+                self.target_path = deque([pos])
+                return self._move_step(game)
         return False
 
+    def _is_free(
+        self,
+        game: "Game",
+        pos: Tuple[int, int],
+        blocked: AbstractSet[Tuple[int, int]],
+    ) -> bool:
+        """Return whether ``pos`` is open ground with no other villager on it.
+
+        ``blocked`` is ``game.building_index.blocked()``, fetched once by the
+        caller for all the tiles it tries.
+        """
+        x, y = pos
+        return (
+            0 <= x < game.map.width
+            and 0 <= y < game.map.height
+            and game.map.get_tile(x, y).passable
+            and pos not in blocked
+            and not any(v is not self for v in game.villagers_at(pos))
+        )
+
     def _avoid_nearby_villagers(self, game: "Game") -> bool:
         """Disabled: previously stepped away from nearby villagers."""
         return False
@@ -168,75 +187,53 @@ class Villager:
             return False
         next_pos = self.target_path[0]
         # Allow passing other villagers, only block if another villager is idle on the tile
-        for v in game.entities:
-            if v is self:
-                continue
-            if v.position == next_pos:
-                if v.target_path and v.target_path[0] == self.position:
-                    # swap positions, other villager moves later
-                    break
+        others = [v for v in game.villagers_at(next_pos) if v is not self]
+        if len(others) > 1:
+            # The first of them in entity order decides, as it always has
+            ids = {id(v) for v in others}
+            others = [v for v in game.entities if id(v) in ids]
+        if others:
+            v = others[0]
+            # Swap positions if it is heading here; it moves later
+            if not (v.target_path and v.target_path[0] == self.position):
                 return False
         tile = game.map.get_tile(*next_pos)
         if not tile.passable:
-            self.target_path = []
+            self.target_path = deque()
             logger.debug(
                 "Villager %s blocked by impassable tile at %s", self.id, next_pos
             )
             return False
-        for b in game.buildings:
-            cells = b.cells() if hasattr(b, "cells") else [b.position]
-            if next_pos in cells and not b.passable:
-                self.target_path = []
-                logger.debug("Villager %s blocked by building at %s", self.id, next_pos)
-                return False
+        if next_pos in game.building_index.blocked():
+            self.target_path = deque()
+            logger.debug("Villager %s blocked by building at %s", self.id, next_pos)
+            return False
 
-        self.position = self.target_path.pop(0)
+        previous = self.position
+        self.position = self.target_path.popleft()
+        game.villager_moved(self, previous)
         game.record_tile_usage(self.position)
-        tile = game.map.get_tile(*self.position)
+        # ``tile`` is the one checked before stepping onto it
         delay = VILLAGER_ACTION_DELAY
         if tile.type is TileType.TREE:
             delay *= 2
         elif tile.type is TileType.ROCK:
             delay *= 3
-        for b in game.buildings:
-            if (
-                b.position == self.position
-                and b.blueprint.name == "Road"
-                and b.complete
-            ):
-                delay = max(1, delay // 2)
-                break
+        if game.completed_near("Road", self.position, 0) is not None:
+            delay = max(1, delay // 2)
         self.cooldown = self._action_delay(game, delay)
         return True
 
     def _wander(self, game: "Game") -> bool:
         """Move to a random adjacent passable tile."""
-        neighbors = [
-            (self.position[0] + 1, self.position[1]),
-            (self.position[0] - 1, self.position[1]),
-            (self.position[0], self.position[1] + 1),
-            (self.position[0], self.position[1] - 1),
-        ]
-        random.shuffle(neighbors)
-        for nx, ny in neighbors:
-            if not (0 <= nx < game.map.width and 0 <= ny < game.map.height):
-                continue
-            tile = game.map.get_tile(nx, ny)
-            if not tile.passable:
-                continue
-            blocked = False
-            for b in game.buildings:
-                cells = b.cells() if hasattr(b, "cells") else [b.position]
-                if (nx, ny) in cells and not b.passable:
-                    blocked = True
-                    break
-            if blocked:
-                continue
-            if any(v.position == (nx, ny) for v in game.entities if v is not self):
-                continue
-            self.target_path = [(nx, ny)]
-            self._move_step(game)
-            return True
+        x, y = self.position
+        blocked = game.building_index.blocked()
+        for dx, dy in _STEP_ORDERS[random.randrange(len(_STEP_ORDERS))]:
+            pos = (x + dx, y + dy)
+            if self._is_free(game, pos, blocked):
+                self.target_path = deque([pos])
+                self._move_step(game)
+                return True
         logger.debug("Villager %s failed to wander from %s", self.id, self.position)
         return False
 
@@ -297,19 +294,28 @@ class Villager:
         )
 
     def update(self, game: "Game") -> None:
-        # Always use the hierarchical pathfinder.  The previous behaviour only
-        # enabled the optimised variant after 25k ticks which caused heavy CPU
-        # load once several villagers were active early on.
-        path_func = find_path_fast
+        # Routes come from ``game.cached_path``, which always uses the fast
+        # pathfinder and shares results between villagers.
+        # Retired villagers stay where they are and only cheer up their
+        # neighbours, so none of the sleep or work logic below applies.
+        if self.life_stage is LifeStage.RETIRED:
+            if self.state != "retired":
+                self.state = "retired"
+                self.target_path = deque()
+            for v in game.villagers_near(self.position):
+                if v is not self:
+                    v.adjust_mood(1)
+            return
+        is_night = game.world.is_night
         # Wake up at dawn
-        if self.state == "sleep" and not game.world.is_night:
+        if self.state == "sleep" and not is_night:
             self.asleep = False
             self.state = "idle"
-            self.target_path = []
+            self.target_path = deque()
         # Head home when night falls. If the house tile is not passable,
         # walk to an adjacent tile instead of trying to path directly onto the
         # building which would fail and cause repeated pathfinding attempts.
-        if game.world.is_night and self.home and self.state != "sleep":
+        if is_night and self.home and self.state != "sleep":
             building = next(
                 (b for b in game.buildings if b.position == self.home), None
             )
@@ -318,335 +324,298 @@ class Villager:
                     self.position,
                     building,
                     game.map,
-                    game.buildings,
+                    game.building_index,
                     search_limit=game.get_search_limit(),
                 )
             else:
-                path = path_func(
-                    self.position,
-                    self.home,
-                    game.map,
-                    game.buildings,
-                    search_limit=game.get_search_limit(),
-                )
-            self.target_path = path[1:]
+                path = game.cached_path(self.position, self.home)
+            self._follow(path)
             self.state = "sleep"
-        if self.life_stage is LifeStage.RETIRED:
-            for v in game.entities:
-                if v is not self and abs(v.x - self.x) <= 1 and abs(v.y - self.y) <= 1:
-                    v.adjust_mood(1)
-            self.state = "retired"
-            return
         if self.personality is Personality.SOCIAL:
-            if any(
-                v is not self and abs(v.x - self.x) <= 1 and abs(v.y - self.y) <= 1
-                for v in game.entities
-            ):
+            if any(v is not self for v in game.villagers_near(self.position)):
                 self.adjust_mood(1)
         if self.cooldown > 0:
             self.cooldown -= 1
             return
         if self._avoid_nearby_villagers(game):
             return
-        if self.state == "idle":
-            if random.random() < 0.2:
-                self._wander(game)
-                return
-            job = game.dispatch_job(self)
-            if not job:
-                self.adjust_mood(-1)
-                return
-            if job.type == "gather":
-                resource_type = (
-                    job.payload if isinstance(job.payload, TileType) else TileType.TREE
-                )
-                reserved = self.reservations.get(resource_type)
-                if reserved:
-                    tile = game.map.get_tile(*reserved)
-                    if tile.resource_amount <= 0:
-                        game.release_resource(reserved)
-                        self.reservations.pop(resource_type, None)
-                        reserved = None
-                if reserved:
-                    path = path_func(
-                        self.position,
-                        reserved,
-                        game.map,
-                        game.buildings,
-                        search_limit=game.get_search_limit(),
-                    )
-                    self.resource_type = resource_type
-                    self.target_resource = reserved
-                    self.target_path = path[1:]
-                    self.state = "gather"
-                    return
-                avoid = [
-                    pos
-                    for pos, (_, rt) in game.reservations.items()
-                    if rt == resource_type
-                ]
-                pos, path = find_nearest_resource(
-                    self.position,
-                    resource_type,
-                    game.map,
-                    game.buildings,
-                    search_limit=game.get_search_limit(),
-                    avoid=avoid,
-                    spacing=3,
-                    area=10,
-                )
-                if pos is None or not game.reserve_resource(
-                    pos, self.id, resource_type
-                ):
-                    self._wander(game)
-                    return
+        handler = _STATE_HANDLERS.get(self.state)
+        if handler is not None:
+            handler(self, game)
+
+    def _tick_idle(self, game: "Game") -> None:
+        """Take a job, or wander, when there is nothing to do."""
+        if random.random() < 0.2:
+            self._wander(game)
+            return
+        job = game.dispatch_job(self)
+        if not job:
+            self.adjust_mood(-1)
+            return
+        if job.type == "gather":
+            resource_type = (
+                job.payload if isinstance(job.payload, TileType) else TileType.TREE
+            )
+            reserved = self.reservations.get(resource_type)
+            if reserved:
+                tile = game.map.get_tile(*reserved)
+                if tile.resource_amount <= 0:
+                    game.release_resource(reserved)
+                    self.reservations.pop(resource_type, None)
+                    reserved = None
+            if reserved:
+                path = game.cached_path(self.position, reserved)
                 self.resource_type = resource_type
-                self.target_resource = pos
-                self.reservations[resource_type] = pos
-                self.target_path = path[1:]
+                self.target_resource = reserved
+                self._follow(path)
                 self.state = "gather"
                 return
-            if job.type == "build":
-                self.target_building = job.payload
-                path = find_path_to_building_adjacent(
-                    self.position,
-                    self.target_building,
-                    game.map,
-                    game.buildings,
-                    search_limit=game.get_search_limit(),
-                )
-                self.target_path = path[1:]
-                if not self.target_path:
-                    logger.debug(
-                        "Villager %s could not path to build site at %s",
-                        self.id,
-                        self.target_building.position,
-                    )
-                self.state = "build"
-                return
-        if self.state == "gather":
-            if self._move_step(game):
-                return
-            if self.target_resource and self.position != self.target_resource:
-                if not self.target_path:
-                    path = path_func(
-                        self.position,
-                        self.target_resource,
-                        game.map,
-                        game.buildings,
-                        search_limit=game.get_search_limit(),
-                    )
-                    self.target_path = path[1:]
-                if not self.target_path:
-                    logger.debug(
-                        "Villager %s could not path to resource at %s",
-                        self.id,
-                        self.target_resource,
-                    )
-                    if self.target_resource:
-                        game.release_resource(self.target_resource)
-                        self.reservations.pop(self.resource_type, None)
-                    self.target_resource = None
-                    self.state = "idle"
-                    self._wander(game)
+            avoid = [
+                pos
+                for pos, (_, rt) in game.reservations.items()
+                if rt == resource_type
+            ]
+            pos, path = find_nearest_resource(
+                self.position,
+                resource_type,
+                game.map,
+                game.building_index,
+                search_limit=game.get_search_limit(),
+                avoid=avoid,
+                spacing=3,
+                area=10,
+            )
+            if pos is None or not game.reserve_resource(pos, self.id, resource_type):
+                self._wander(game)
                 return
-            if self.target_resource and self.position == self.target_resource:
-                tile = game.map.get_tile(*self.position)
-                rate = 1
-                for b in game.buildings:
-                    if b.blueprint.name == "Quarry" and b.complete:
-                        bx, by = b.position
-                        if (
-                            abs(bx - self.position[0]) <= 5
-                            and abs(by - self.position[1]) <= 5
-                        ):
-                            rate = 2
-                            break
-                gained = tile.extract(rate)
-                if self.resource_type is TileType.ROCK:
-                    self.inventory["stone"] += gained
-                else:
-                    self.inventory["wood"] += gained
-                self.adjust_mood(1)
-                self.cooldown = self._action_delay(game, VILLAGER_ACTION_DELAY)
-                if tile.resource_amount == 0:
-                    game.release_resource(self.target_resource)
-                    self.reservations.pop(self.resource_type, None)
-                    self.target_resource = None
-                    if sum(self.inventory.values()) > 0:
-                        self.state = "deliver"
-                    else:
-                        self.state = "idle"
-                    self.target_path = []
-                elif self.is_full():
-                    self.state = "deliver"
-                    self.target_path = []
+            self.resource_type = resource_type
+            self.target_resource = pos
+            self.reservations[resource_type] = pos
+            self._follow(path)
+            self.state = "gather"
+            return
+        if job.type == "build":
+            self.target_building = job.payload
+            path = find_path_to_building_adjacent(
+                self.position,
+                self.target_building,
+                game.map,
+                game.building_index,
+                search_limit=game.get_search_limit(),
+            )
+            self._follow(path)
+            if not self.target_path:
+                logger.debug(
+                    "Villager %s could not path to build site at %s",
+                    self.id,
+                    self.target_building.position,
+                )
+            self.state = "build"
             return
-        if self.state == "deliver":
-            # Immediately deliver if we're already on a storage tile
-            if self.position in game.storage_positions:
-                for res in ("wood", "stone"):
-                    if self.inventory.get(res, 0) > 0:
-                        game.adjust_storage(res, self.inventory.get(res, 0))
-                        self.inventory[res] = 0
-                self.adjust_mood(1)
-                self.cooldown = self._action_delay(game, VILLAGER_ACTION_DELAY)
-                # Once enough wood has been stockpiled for the very first house,
-                # stop gathering and allow a build job to be assigned.
-                if (
-                    game._count_buildings("House") == 0
-                    and game.storage["wood"] >= game.house_threshold
-                ):
-                    if self.target_resource:
-                        game.release_resource(self.target_resource)
-                        self.reservations.pop(self.resource_type, None)
-                    self.target_resource = None
-                    self.resource_type = None
-                    self.state = "idle"
-                    self.target_path = []
-                    return
-                if (
-                    self.target_resource
-                    and game.map.get_tile(*self.target_resource).resource_amount > 0
-                ):
-                    path = path_func(
-                        self.position,
-                        self.target_resource,
-                        game.map,
-                        game.buildings,
-                        search_limit=game.get_search_limit(),
-                    )
-                    self.target_path = path[1:]
-                    self.state = "gather"
-                else:
-                    if self.target_resource:
-                        game.release_resource(self.target_resource)
-                        self.reservations.pop(self.resource_type, None)
-                    self.target_resource = None
-                    self.resource_type = None
-                    self.state = "idle"
-                    self.target_path = []
-                return
 
+    def _tick_gather(self, game: "Game") -> None:
+        """Walk to the reserved resource and extract from it."""
+        if self._move_step(game):
+            return
+        if self.target_resource and self.position != self.target_resource:
             if not self.target_path:
-                self.target_storage = game.nearest_storage(self.position)
-                path = path_func(
-                    self.position,
-                    self.target_storage,
-                    game.map,
-                    game.buildings,
-                    search_limit=game.get_search_limit(),
+                path = game.cached_path(self.position, self.target_resource)
+                self._follow(path)
+            if not self.target_path:
+                logger.debug(
+                    "Villager %s could not path to resource at %s",
+                    self.id,
+                    self.target_resource,
                 )
-                self.target_path = path[1:]
-                if not self.target_path:
-                    logger.debug(
-                        "Villager %s could not path to storage at %s",
-                        self.id,
-                        self.target_storage,
-                    )
-                    if self.target_resource:
-                        game.release_resource(self.target_resource)
-                        self.reservations.pop(self.resource_type, None)
-                        self.target_resource = None
-                        self.resource_type = None
+                if self.target_resource:
+                    game.release_resource(self.target_resource)
+                    self.reservations.pop(self.resource_type, None)
+                self.target_resource = None
+                self.state = "idle"
+                self._wander(game)
+            return
+        if self.target_resource and self.position == self.target_resource:
+            tile = game.map.get_tile(*self.position)
+            rate = 1
+            if game.completed_near("Quarry", self.position, 5) is not None:
+                rate = 2
+            gained = game.map.extract_tile(*self.position, tile, rate)
+            if self.resource_type is TileType.ROCK:
+                self.stone += gained
+            else:
+                self.wood += gained
+            self.adjust_mood(1)
+            self.cooldown = self._action_delay(game, VILLAGER_ACTION_DELAY)
+            if tile.resource_amount == 0:
+                game.release_resource(self.target_resource)
+                self.reservations.pop(self.resource_type, None)
+                self.target_resource = None
+                if self.wood or self.stone:
+                    self.state = "deliver"
+                else:
                     self.state = "idle"
-                    self._wander(game)
-                    return
+                self.target_path = deque()
+            elif self.is_full():
+                self.state = "deliver"
+                self.target_path = deque()
 
-            if self._move_step(game):
-                return
-        if self.state == "build":
-            if self._move_step(game):
+    def _tick_deliver(self, game: "Game") -> None:
+        """Carry resources back to storage."""
+        # Immediately deliver if we're already on a storage tile
+        if self.position in game.storage_positions:
+            if self.wood > 0:
+                game.adjust_storage("wood", self.wood)
+                self.wood = 0
+            if self.stone > 0:
+                game.adjust_storage("stone", self.stone)
+                self.stone = 0
+            self.adjust_mood(1)
+            self.cooldown = self._action_delay(game, VILLAGER_ACTION_DELAY)
+            # Once enough wood has been stockpiled for the very first house,
+            # stop gathering and allow a build job to be assigned.
+            if (
+                game._count_buildings("House") == 0
+                and game.storage["wood"] >= game.house_threshold
+            ):
+                if self.target_resource:
+                    game.release_resource(self.target_resource)
+                    self.reservations.pop(self.resource_type, None)
+                self.target_resource = None
+                self.resource_type = None
+                self.state = "idle"
+                self.target_path = deque()
                 return
             if (
-                self.target_building
-                and not self.target_path
-                and (
-                    abs(self.position[0] - self.target_building.position[0])
-                    + abs(self.position[1] - self.target_building.position[1])
-                    > 1
-                )
+                self.target_resource
+                and game.map.get_tile(*self.target_resource).resource_amount > 0
             ):
-                path = find_path_to_building_adjacent(
-                    self.position,
-                    self.target_building,
-                    game.map,
-                    game.buildings,
-                    search_limit=game.get_search_limit(),
+                path = game.cached_path(self.position, self.target_resource)
+                self._follow(path)
+                self.state = "gather"
+            else:
+                if self.target_resource:
+                    game.release_resource(self.target_resource)
+                    self.reservations.pop(self.resource_type, None)
+                self.target_resource = None
+                self.resource_type = None
+                self.state = "idle"
+                self.target_path = deque()
+            return
+
+        if not self.target_path:
+            self.target_storage = game.nearest_storage(self.position)
+            path = game.cached_path(self.position, self.target_storage)
+            self._follow(path)
+            if not self.target_path:
+                logger.debug(
+                    "Villager %s could not path to storage at %s",
+                    self.id,
+                    self.target_storage,
                 )
-                self.target_path = path[1:]
-                if not self.target_path:
-                    logger.debug(
-                        "Villager %s lost path to build site at %s",
-                        self.id,
-                        self.target_building.position if self.target_building else None,
-                    )
-                    self.state = "idle"
-                    self._wander(game)
+                if self.target_resource:
+                    game.release_resource(self.target_resource)
+                    self.reservations.pop(self.resource_type, None)
+                    self.target_resource = None
+                    self.resource_type = None
+                self.state = "idle"
+                self._wander(game)
                 return
-            if self.target_building and (
+
+        if self._move_step(game):
+            return
+
+    def _tick_build(self, game: "Game") -> None:
+        """Walk to the construction site and work on it."""
+        if self._move_step(game):
+            return
+        if (
+            self.target_building
+            and not self.target_path
+            and (
                 abs(self.position[0] - self.target_building.position[0])
                 + abs(self.position[1] - self.target_building.position[1])
-                == 1
-            ):
-                self.target_building.progress += 1
-                self.adjust_mood(1)
-                self.cooldown = self._action_delay(game, VILLAGER_ACTION_DELAY)
-                if self.target_building.complete:
-                    self.target_building.passable = (
-                        self.target_building.blueprint.passable
-                    )
-                    if self.target_building in game.build_queue:
-                        game.build_queue.remove(self.target_building)
-                    # Remove any queued build jobs for this now-complete building
-                    game.jobs = [
-                        j for j in game.jobs if j.payload is not self.target_building
-                    ]
-                    self.target_building.builder_id = None
-                    if self.target_building.blueprint.name == "Storage":
-                        game.storage_capacity += self.target_building.blueprint.capacity_bonus
-                    if self.target_building.blueprint.name == "House":
-                        game.schedule_spawn(self.target_building.position)
-                else:
-                    from .game import Job
-
-                    game.jobs.append(Job("build", self.target_building))
-                    # Stay in build state to continue working on the same building
-                    return
-                self.state = "idle"
-        if self.state == "sleep":
-            building = next(
-                (b for b in game.buildings if b.position == self.home), None
+                > 1
             )
-            at_home = self.position == self.home
-            if building and not building.passable:
-                at_home = (
-                    abs(self.position[0] - self.home[0])
-                    + abs(self.position[1] - self.home[1])
-                ) == 1
-            if not at_home:
-                if not self.target_path:
-                    if building and not building.passable:
-                        path = find_path_to_building_adjacent(
-                            self.position,
-                            building,
-                            game.map,
-                            game.buildings,
-                            search_limit=game.get_search_limit(),
-                        )
-                    else:
-                        path = path_func(
-                            self.position,
-                            self.home,
-                            game.map,
-                            game.buildings,
-                            search_limit=game.get_search_limit(),
-                        )
-                    self.target_path = path[1:]
-                self._move_step(game)
+        ):
+            path = find_path_to_building_adjacent(
+                self.position,
+                self.target_building,
+                game.map,
+                game.building_index,
+                search_limit=game.get_search_limit(),
+            )
+            self._follow(path)
+            if not self.target_path:
+                logger.debug(
+                    "Villager %s lost path to build site at %s",
+                    self.id,
+                    self.target_building.position if self.target_building else None,
+                )
+                self.state = "idle"
+                self._wander(game)
+            return
+        if self.target_building and (
+            abs(self.position[0] - self.target_building.position[0])
+            + abs(self.position[1] - self.target_building.position[1])
+            == 1
+        ):
+            self.target_building.progress += 1
+            self.adjust_mood(1)
+            self.cooldown = self._action_delay(game, VILLAGER_ACTION_DELAY)
+            if self.target_building.complete:
+                self.target_building.passable = (
+                    self.target_building.blueprint.passable
+                )
+                game.remove_from_build_queue(self.target_building)
+                # Remove any queued build jobs for this now-complete building
+                game.jobs = [
+                    j for j in game.jobs if j.payload is not self.target_building
+                ]
+                self.target_building.builder_id = None
+                game.invalidate_sites()
+                if self.target_building.blueprint.name == "Storage":
+                    game.storage_capacity += self.target_building.blueprint.capacity_bonus
+                if self.target_building.blueprint.name == "House":
+                    game.schedule_spawn(self.target_building.position)
             else:
-                self.asleep = True
+                # Offer the same help-wanted job each tick rather than a
+                # fresh one
+                job = self._build_job
+                if job is None or job.payload is not self.target_building:
+                    job = self._build_job = Job("build", self.target_building)
+                game.jobs.append(job)
+                # Stay in build state to continue working on the same building
+                return
+            self.state = "idle"
+
+    def _tick_sleep(self, game: "Game") -> None:
+        """Walk home and sleep there until dawn."""
+        if self.asleep:
+            # Already home; ``update`` wakes the villager once night ends.
             return
+        building = next((b for b in game.buildings if b.position == self.home), None)
+        at_home = self.position == self.home
+        if building and not building.passable:
+            at_home = (
+                abs(self.position[0] - self.home[0])
+                + abs(self.position[1] - self.home[1])
+            ) == 1
+        if not at_home:
+            if not self.target_path:
+                if building and not building.passable:
+                    path = find_path_to_building_adjacent(
+                        self.position,
+                        building,
+                        game.map,
+                        game.building_index,
+                        search_limit=game.get_search_limit(),
+                    )
+                else:
+                    path = game.cached_path(self.position, self.home)
+                self._follow(path)
+            self._move_step(game)
+        else:
+            self.asleep = True
 
     @property
     def x(self) -> int:
@@ -655,3 +624,14 @@ class Villager:
     @property
     def y(self) -> int:
         return self.position[1]
+
+
+# Per-tick behaviour for each working state; other states (such as
+# "retired") have nothing to do once ``Villager.update`` reaches them.
+_STATE_HANDLERS = {
+    "idle": Villager._tick_idle,
+    "gather": Villager._tick_gather,
+    "deliver": Villager._tick_deliver,
+    "build": Villager._tick_build,
+    "sleep": Villager._tick_sleep,
+}
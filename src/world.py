@@ -11,6 +11,12 @@ class World:
         self.day_length = day_length or tick_rate * 24
         self.tick_count = 0
         self.day = 0
+        # ``is_night`` and ``time_of_day`` are read many times per tick, so
+        # each is kept for the tick it was worked out on.
+        self._night_stamp: int | None = None
+        self._night = False
+        self._clock_stamp: int | None = None
+        self._clock = ""
 
     def tick(self) -> None:
         """Advance world time by one tick."""
@@ -22,17 +28,23 @@ class World:
     @property
     def is_night(self) -> bool:
         """Return True if time is between 23:00 and 06:00."""
-        hour = int(self.day_fraction * 24)
-        return hour >= 23 or hour < 6
+        if self._night_stamp != self.tick_count:
+            hour = (self.tick_count % self.day_length) * 24 // self.day_length
+            self._night = hour >= 23 or hour < 6
+            self._night_stamp = self.tick_count
+        return self._night
 
     @property
     def time_of_day(self) -> str:
         """Return the current time of day as ``HH:MM``."""
-        cycle_pos = self.tick_count % self.day_length
-        day_fraction = cycle_pos / self.day_length
-        hours = int(day_fraction * 24)
-        minutes = int((day_fraction * 24 - hours) * 60)
-        return f"{hours:02d}:{minutes:02d}"
+        if self._clock_stamp != self.tick_count:
+            cycle_pos = self.tick_count % self.day_length
+            day_fraction = cycle_pos / self.day_length
+            hours = int(day_fraction * 24)
+            minutes = int((day_fraction * 24 - hours) * 60)
+            self._clock = f"{hours:02d}:{minutes:02d}"
+            self._clock_stamp = self.tick_count
+        return self._clock
 
     @property
     def day_fraction(self) -> float:
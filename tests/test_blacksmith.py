@@ -14,3 +14,18 @@ def test_blacksmith_speed_bonus():
     vill.position = pos
     delay = vill._apply_tool_bonus(game, VILLAGER_ACTION_DELAY)
     assert delay < VILLAGER_ACTION_DELAY
+
+
+def test_completed_near_tracks_new_and_distant_buildings():
+    game = Game(seed=42)
+    bp = game.blueprints["Blacksmith"]
+    x, y = game.townhall_pos
+    far = Building(bp, (x + 6, y), progress=bp.build_time)
+    game.buildings.append(far)
+    assert game.completed_near("Blacksmith", (x, y), 5) is None
+    site = Building(bp, (x - 5, y + 5), progress=0)
+    game.buildings.append(site)
+    assert game.completed_near("Blacksmith", (x, y), 5) is None
+    site.progress = bp.build_time
+    game.invalidate_sites()
+    assert game.completed_near("Blacksmith", (x, y), 5) is site
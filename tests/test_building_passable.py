@@ -18,3 +18,30 @@ def test_road_remains_passable_after_built():
     vill.update(game)
     assert b.complete
     assert b.passable is True
+
+
+def test_completed_road_leaves_equal_queued_copy():
+    game = Game(seed=1)
+    vill = game.entities[0]
+    bp = BLUEPRINTS["Road"]
+    twin = Building(bp, (vill.x + 1, vill.y), progress=bp.build_time - 1)
+    b = Building(bp, (vill.x + 1, vill.y), progress=bp.build_time - 1)
+    game.buildings.append(b)
+    game.build_queue.extend([twin, b])
+
+    vill.state = "build"
+    vill.target_building = b
+    vill.target_path = []
+    vill.update(game)
+    assert b.complete
+    assert len(game.build_queue) == 1 and game.build_queue[0] is twin
+
+
+def test_cells_follow_moved_building():
+    bp = BLUEPRINTS["House"]
+    b = Building(bp, (10, 10))
+    cells = b.cells()
+    assert cells == {(10 + dx, 10 + dy) for dx, dy in bp.footprint}
+    assert b.cells() is cells
+    b.position = (20, 10)
+    assert b.cells() == {(20 + dx, 10 + dy) for dx, dy in bp.footprint}
@@ -78,3 +78,241 @@ def test_road_orientation(monkeypatch):
     renderer.render_game(gmap, camera, [], [r1, r2], detailed=False)
     assert captured["glyphs"][0][0] == "-"
     assert captured["glyphs"][0][1] == "-"
+
+
+def test_zoomed_rows_are_independent(monkeypatch):
+    gmap = GameMap(seed=1)
+    renderer = Renderer()
+    camera = Camera()
+    camera.set_zoom_level(1)
+    bp = BuildingBlueprint(
+        name="Test", build_time=0, footprint=[(0, 0)], glyph="B", color=Color.BUILDING
+    )
+    captured = {}
+
+    def fake_draw(g, c):
+        captured["glyphs"] = g
+
+    monkeypatch.setattr(renderer, "draw_grid", fake_draw)
+    renderer.render_game(gmap, camera, [], [Building(bp, (0, 0))], is_night=True)
+    glyphs = captured["glyphs"]
+    assert glyphs[0][0] == "B"
+    assert glyphs[1][0] == glyphs[0][1] == glyphs[1][1] != "B"
+    assert glyphs[1][0].islower() or not glyphs[1][0].isalpha()
+
+
+def test_road_orientation_vertical_and_junction(monkeypatch):
+    gmap = GameMap(seed=1)
+    renderer = Renderer()
+    camera = Camera()
+    camera.set_zoom_level(0)
+    camera.x = 0
+    camera.y = 0
+    road_bp = BLUEPRINTS["Road"]
+    done = road_bp.build_time
+    roads = [
+        Building(road_bp, (0, 0), progress=done),
+        Building(road_bp, (0, 1), progress=done),
+        Building(road_bp, (1, 1), progress=done),
+        # Unfinished roads do not count as neighbours
+        Building(road_bp, (3, 0), progress=0),
+        Building(road_bp, (3, 1), progress=done),
+    ]
+    captured = {}
+
+    def fake_draw(g, c):
+        captured["glyphs"] = g
+
+    monkeypatch.setattr(renderer, "draw_grid", fake_draw)
+    renderer.render_game(gmap, camera, [], roads, detailed=False)
+    assert captured["glyphs"][0][0] == "|"
+    assert captured["glyphs"][1][0] == "+"
+    assert captured["glyphs"][1][3] == "+"
+
+
+def test_terrain_rows_reused_until_map_changes(monkeypatch):
+    from src.constants import TileType
+    from src.tile import Tile
+
+    gmap = GameMap(seed=1)
+    renderer = Renderer()
+    camera = Camera()
+    camera.set_zoom_level(0)
+    captured = {}
+
+    def fake_draw(g, c):
+        captured["glyphs"] = g
+
+    monkeypatch.setattr(renderer, "draw_grid", fake_draw)
+    renderer.render_game(gmap, camera, [], [])
+
+    lookups = []
+    real_get_tile = gmap.get_tile
+
+    def counting_get_tile(x, y):
+        lookups.append((x, y))
+        return real_get_tile(x, y)
+
+    monkeypatch.setattr(gmap, "get_tile", counting_get_tile)
+    renderer.render_game(gmap, camera, [], [])
+    assert lookups == []
+
+    gmap.set_tile(1, 1, Tile(TileType.WATER, 0, False))
+    renderer.render_game(gmap, camera, [], [])
+    assert captured["glyphs"][1][1] == "W"
+
+
+def test_road_orientation_uses_every_road_cell(monkeypatch):
+    gmap = GameMap(seed=1)
+    renderer = Renderer()
+    camera = Camera()
+    camera.set_zoom_level(0)
+    long_road = BuildingBlueprint(
+        name="Road",
+        build_time=0,
+        footprint=[(0, 0), (0, 1)],
+        glyph="#",
+        color=Color.PATH,
+    )
+    road_bp = BLUEPRINTS["Road"]
+    roads = [
+        Building(long_road, (0, 0)),
+        Building(road_bp, (1, 1), progress=road_bp.build_time),
+    ]
+    captured = {}
+
+    def fake_draw(g, c):
+        captured["glyphs"] = g
+
+    monkeypatch.setattr(renderer, "draw_grid", fake_draw)
+    renderer.render_game(gmap, camera, [], roads, detailed=False)
+    # (1, 1) only touches the second cell of the two-cell road
+    assert captured["glyphs"][1][1] == "-"
+
+
+def test_overlays_do_not_leak_into_later_frames(monkeypatch):
+    gmap = GameMap(seed=1)
+    renderer = Renderer()
+    camera = Camera()
+    camera.set_zoom_level(0)
+    bp = BuildingBlueprint(
+        name="Test", build_time=0, footprint=[(0, 0)], glyph="B", color=Color.BUILDING
+    )
+    captured = {}
+
+    def fake_draw(g, c):
+        captured["glyphs"] = g
+
+    monkeypatch.setattr(renderer, "draw_grid", fake_draw)
+    renderer.render_game(gmap, camera, [], [Building(bp, (2, 2))])
+    assert captured["glyphs"][2][2] == "B"
+    renderer.render_game(gmap, camera, [], [])
+    assert captured["glyphs"][2][2] != "B"
+
+
+def test_lighting_cached_until_the_hour_changes(monkeypatch):
+    import src.renderer as renderer_mod
+
+    gmap = GameMap(seed=1)
+    renderer = Renderer()
+    camera = Camera()
+    monkeypatch.setattr(renderer, "draw_grid", lambda g, c: None)
+    calls = []
+    real = renderer_mod.apply_lighting
+
+    def counting(tile, day_fraction, filters):
+        calls.append(day_fraction)
+        return real(tile, day_fraction, filters)
+
+    monkeypatch.setattr(renderer_mod, "apply_lighting", counting)
+    renderer.render_game(gmap, camera, [], [], day_fraction=0.5)
+    first = len(calls)
+    assert 0 < first < 10
+    # New rows in the same hour reuse the cached colours
+    camera.y += 5
+    renderer.render_game(gmap, camera, [], [], day_fraction=0.51)
+    assert len(calls) == first
+    renderer.render_game(gmap, camera, [], [], day_fraction=0.9)
+    assert len(calls) > first
+
+
+def test_path_overlay_follows_consumed_path(monkeypatch):
+    from types import SimpleNamespace
+
+    from src.constants import Mood
+
+    gmap = GameMap(seed=1)
+    renderer = Renderer()
+    camera = Camera()
+    camera.set_zoom_level(0)
+    captured = {}
+
+    def fake_draw(g, c):
+        captured["glyphs"] = g
+
+    monkeypatch.setattr(renderer, "draw_grid", fake_draw)
+    path = [(1, 5), (2, 5), (3, 5), (4, 5)]
+    # Drawn away from its path so the villager glyphs do not cover it
+    vill = SimpleNamespace(x=0, y=0, mood=Mood.HAPPY, target_path=path)
+    renderer.render_game(gmap, camera, [vill], [])
+    assert [captured["glyphs"][5][x] for x in (1, 2, 3)] == ["\xb7"] * 3
+    path.pop(0)
+    path.pop(0)
+    renderer.render_game(gmap, camera, [vill], [])
+    row = captured["glyphs"][5]
+    assert row[1] != "\xb7" and row[3] == "\xb7" and row[4] != "\xb7"
+
+
+def test_render_timings_only_taken_when_debug_logging(monkeypatch, caplog):
+    import logging
+
+    import src.renderer as renderer_mod
+
+    gmap = GameMap(seed=1)
+    renderer = Renderer()
+    camera = Camera()
+    monkeypatch.setattr(renderer, "draw_grid", lambda g, c: None)
+    samples = []
+    real_clock = renderer_mod.time.perf_counter
+
+    def clock():
+        samples.append(1)
+        return real_clock()
+
+    monkeypatch.setattr(renderer_mod.time, "perf_counter", clock)
+    caplog.set_level(logging.INFO, logger="src.renderer")
+    renderer.render_game(gmap, camera, [], [])
+    assert samples == []
+    caplog.set_level(logging.DEBUG, logger="src.renderer")
+    renderer.render_game(gmap, camera, [], [])
+    assert samples
+    assert "render_game took" in caplog.text
+
+
+def test_building_glyph_resolved_once_and_only_in_view(monkeypatch):
+    gmap = GameMap(seed=1)
+    renderer = Renderer()
+    camera = Camera()
+    bp = BuildingBlueprint(
+        name="Hall",
+        build_time=5,
+        footprint=[(0, 0), (1, 0), (0, 1), (1, 1)],
+        glyph="H",
+        color=Color.BUILDING,
+    )
+    near = Building(bp, (2, 2))
+    far = Building(bp, (camera.visible_tiles_x + 5, 2))
+    calls = []
+    for b in (near, far):
+        real = b.glyph_for_progress
+        monkeypatch.setattr(
+            b, "glyph_for_progress", lambda b=b, real=real: calls.append(b) or real()
+        )
+    captured = {}
+    monkeypatch.setattr(
+        renderer, "draw_grid", lambda g, c: captured.setdefault("grid", g)
+    )
+    renderer.render_game(gmap, camera, [], [near, far])
+    assert calls == [near]
+    grid = captured["grid"]
+    assert [grid[y][x] for x, y in near.cells()] == ["."] * 4
@@ -27,3 +27,19 @@ def test_villager_stays_adjacent_while_building():
     assert building.complete
     for p in building_positions:
         assert abs(p[0] - pos[0]) + abs(p[1] - pos[1]) == 1
+
+
+def test_builder_requeues_one_help_job():
+    game = Game(seed=42)
+    vill = game.entities[0]
+    bp = game.blueprints["House"]
+    building = Building(bp, (game.townhall_pos[0] + 1, game.townhall_pos[1]))
+    game.buildings.append(building)
+    vill.state = "build"
+    vill.target_building = building
+    for _ in range(3):
+        vill.cooldown = 0
+        vill.update(game)
+    jobs = [j for j in game.jobs if j.payload is building]
+    assert len(jobs) == 3
+    assert all(j is jobs[0] for j in jobs)
@@ -0,0 +1,10 @@
+from src.camera import Camera
+
+
+def test_world_to_screen_batch_matches_single():
+    camera = Camera(x=10, y=5)
+    camera.set_zoom_level(2)
+    points = [(10, 5), (12, 7), (9, 4)]
+    assert camera.world_to_screen_batch(points) == [
+        camera.world_to_screen(x, y) for x, y in points
+    ]
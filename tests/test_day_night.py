@@ -17,6 +17,17 @@ def test_world_time_of_day():
     assert world.time_of_day == "12:00"
 
 
+def test_world_clock_follows_tick_count():
+    world = World(tick_rate=30)
+    for _ in range(world.day_length):
+        hour = int(world.day_fraction * 24)
+        assert world.is_night == (hour >= 23 or hour < 6)
+        assert world.time_of_day.startswith(f"{hour:02d}:")
+        world.tick()
+    world.tick_count = world.day_length // 2
+    assert not world.is_night and world.time_of_day == "12:00"
+
+
 def test_villager_slow_at_night():
     game = Game(seed=1)
     vill = game.entities[0]
@@ -1,4 +1,6 @@
 from src.game import Game
+from src.constants import TileType
+from src.tile import Tile
 
 
 def test_villager_gather_cycle():
@@ -12,3 +14,61 @@ def test_villager_gather_cycle():
             break
     assert game.storage["wood"] >= 0
     assert vill.state in {"idle", "gather", "deliver", "build"}
+
+
+def test_villager_consumes_path_in_place():
+    game = Game(seed=42)
+    vill = game.entities[0]
+    x, y = vill.position
+    route = [(x, y), (x + 1, y), (x + 2, y)]
+    for pos in route:
+        game.map.set_tile(*pos, Tile(TileType.GRASS))
+    vill._follow(route)
+    remaining = vill.target_path
+    assert list(remaining) == route[1:]
+    assert vill._move_step(game)
+    assert vill.position == (x + 1, y)
+    assert vill.target_path is remaining and list(remaining) == [(x + 2, y)]
+
+
+def test_gather_sees_replaced_resource_tile():
+    game = Game(seed=42)
+    vill = game.entities[0]
+    pos = vill.position
+    game.map.set_tile(*pos, Tile(TileType.ROCK, 50, True))
+    vill.state = "gather"
+    vill.resource_type = TileType.ROCK
+    vill.target_resource = pos
+    vill.update(game)
+    assert vill.stone == 1 and vill.state == "gather"
+    game.map.set_tile(*pos, Tile(TileType.ROCK, 1, True))
+    vill.cooldown = 0
+    vill.update(game)
+    assert vill.stone == 2
+    assert vill.state == "deliver"
+
+
+def test_move_step_blocked_by_footprint_and_idle_villager():
+    from collections import deque
+
+    from src.building import Building
+    from src.villager import Villager
+
+    game = Game(seed=42)
+    vill = game.entities[0]
+    x, y = vill.position
+    for pos in ((x + 1, y), (x + 2, y), (x, y + 1)):
+        game.map.set_tile(*pos, Tile(TileType.GRASS))
+    house = Building(game.blueprints["House"], (x + 1, y), passable=False)
+    game.buildings.append(house)
+    vill.target_path = deque([(x + 1, y)])
+    assert not vill._move_step(game)
+    assert not vill.target_path
+
+    other = Villager(id=9, position=(x, y + 1))
+    game.entities.append(other)
+    vill.target_path = deque([(x, y + 1)])
+    assert not vill._move_step(game)
+    other.target_path = deque([(x, y)])
+    assert vill._move_step(game)
+    assert vill.position == (x, y + 1)
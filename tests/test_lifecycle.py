@@ -1,3 +1,5 @@
+import pytest
+
 from src.game import Game
 from src.building import Building
 from src.constants import LifeStage
@@ -26,3 +28,18 @@ def test_birth_requires_food_and_housing():
     game._handle_births()
     game._process_spawns()
     assert any(v.life_stage is LifeStage.CHILD for v in game.entities)
+
+
+def test_retired_villager_stays_put_at_night(monkeypatch):
+    game = Game(seed=1)
+    vill = game.entities[0]
+    vill.life_stage = LifeStage.RETIRED
+    vill.home = (vill.x + 4, vill.y)
+    game.world.tick_count = 0
+    assert game.world.is_night
+    monkeypatch.setattr(game, "cached_path", lambda *a: pytest.fail("pathed home"))
+    start = vill.position
+    vill.update(game)
+    vill.update(game)
+    assert vill.state == "retired"
+    assert vill.position == start and not vill.target_path
@@ -1,4 +1,10 @@
-from src.filters import apply_lighting, day_night_filter, zone_filter
+from src.filters import (
+    apply_lighting,
+    day_night_filter,
+    pack_rgb,
+    unpack_rgb,
+    zone_filter,
+)
 from src.tile import Tile
 from src.constants import TileType, ZoneType
 
@@ -20,3 +26,8 @@ def test_apply_lighting_combines():
     tile = Tile(TileType.GRASS, zone=ZoneType.HOUSING)
     result = apply_lighting(tile, 0.5, [zone_filter, day_night_filter])
     assert result == (42, 169, 42)
+
+
+def test_pack_rgb_round_trip():
+    assert pack_rgb((42, 169, 42)) == 0x2AA92A
+    assert unpack_rgb(pack_rgb((255, 0, 7))) == (255, 0, 7)
@@ -1,5 +1,7 @@
-from src.map import GameMap
+from src.map import GameMap, ResourceCluster
 from src.pathfinding import find_path
+from src.constants import TileType
+from src.tile import Tile
 
 
 def test_map_connectivity():
@@ -10,3 +12,62 @@ def test_map_connectivity():
     goal = (10, 10)
     path = find_path(start, goal, gmap, [])
     assert path, "no path between corners"
+
+
+def test_resource_clusters_cached_until_depleted():
+    gmap = GameMap(seed=1)
+    gmap.set_tile(5, 5, Tile(TileType.ROCK, 1, True))
+    gmap.set_tile(6, 5, Tile(TileType.ROCK, 1, True))
+    clusters = gmap.resource_clusters(TileType.ROCK, 5, 5, 6, 5)
+    assert any({(5, 5), (6, 5)} <= set(c.tiles) for c in clusters)
+    assert gmap.resource_clusters(TileType.ROCK, 5, 5, 6, 5) == clusters
+
+    version = gmap.version
+    assert gmap.extract(5, 5, 1) == 1
+    assert gmap.version > version
+    clusters = gmap.resource_clusters(TileType.ROCK, 5, 5, 6, 5)
+    assert all((5, 5) not in c.tiles for c in clusters)
+
+
+def test_extract_tile_uses_the_given_tile():
+    gmap = GameMap(seed=1)
+    tile = Tile(TileType.TREE, 2, True)
+    gmap.set_tile(7, 7, tile)
+    version = gmap.version
+    assert gmap.extract_tile(7, 7, tile, 1) == 1
+    assert gmap.version == version
+    assert gmap.extract_tile(7, 7, tile, 5) == 1
+    assert tile.resource_amount == 0 and gmap.version > version
+
+
+def test_track_changes_collects_tiles_until_cleared():
+    gmap = GameMap(seed=1)
+    gmap.set_tile(3, 3, Tile(TileType.GRASS, 0, True))
+    changed = gmap.track_changes()
+    assert not changed
+    gmap.set_tile(4, 4, Tile(TileType.WATER, 0, False))
+    gmap.set_tile(4, 4, Tile(TileType.GRASS, 0, True))
+    assert changed == {(4, 4)}
+    changed.clear()
+    gmap.set_tile(5, 4, Tile(TileType.GRASS, 0, True))
+    assert changed == {(5, 4)}
+
+
+def test_resource_cluster_nearest_skips_avoided_tiles():
+    cluster = ResourceCluster([(3, 0), (4, 0), (4, 1)], (3, 0, 4, 1))
+    assert cluster.nearest(0, 0) == ((3, 0), 3)
+    assert cluster.nearest(0, 0, {(3, 0)}) == ((4, 0), 4)
+    assert cluster.nearest(0, 0, set(cluster.tiles)) == (None, -1)
+
+
+def test_passable_cache_tracks_set_tile():
+    gmap = GameMap(seed=1)
+    gmap.set_tile(4, 4, Tile(TileType.GRASS, 0, True))
+    assert gmap.passable(4, 4)
+    gmap.set_tile(4, 4, Tile(TileType.WATER, 0, False))
+    assert not gmap.passable(4, 4)
+
+
+def test_tiles_have_no_instance_dict():
+    tile = GameMap(seed=1).get_tile(5, 5)
+    assert not hasattr(tile, "__dict__")
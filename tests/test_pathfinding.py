@@ -1,8 +1,19 @@
 from src.map import GameMap
-from src.pathfinding import find_path, find_nearest_resource, find_path_hierarchical
-from src.constants import TileType
+from src.pathfinding import (
+    _blocked_cells,
+    find_nearest_resource,
+    find_path,
+    find_path_bidir,
+    find_path_fast,
+    find_path_hierarchical,
+    find_path_jps,
+    find_path_to_building_adjacent,
+    nearest_passable,
+)
+from src.constants import Color, TileType
+from src.tile import Tile
 from src.blueprints import BLUEPRINTS
-from src.building import Building
+from src.building import Building, BuildingBlueprint, BuildingIndex
 
 
 def test_find_path_valid_steps():
@@ -46,3 +57,209 @@ def test_hierarchical_path_returns_to_goal():
     for a, b in zip(path, path[1:]):
         dx = abs(a[0] - b[0]) + abs(a[1] - b[1])
         assert dx == 1
+
+
+def test_jps_matches_astar_length_around_water():
+    gmap = GameMap(seed=3)
+    for y in range(0, 12):
+        gmap._tiles[(6, y)] = Tile(TileType.WATER, 0, False)
+    start = (0, 0)
+    goal = (12, 0)
+    expected = find_path(start, goal, gmap, [])
+    path = find_path_jps(start, goal, gmap, [])
+    assert path[0] == start and path[-1] == goal
+    assert len(path) == len(expected)
+    for a, b in zip(path, path[1:]):
+        assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1
+    assert all(gmap.get_tile(*p).passable for p in path)
+
+
+def test_fast_path_rejects_jps_detour_when_shorter_route_leaves_window():
+    gmap = GameMap(seed=7)
+    for x in range(0, 80):
+        for y in range(50, 140):
+            gmap.set_tile(x, y, Tile(TileType.GRASS, 0, True))
+    # Inside the default window the walls only open at opposite ends, while
+    # the short way round passes above the window.
+    for y in range(64, 132):
+        gmap.set_tile(20, y, Tile(TileType.WATER, 0, False))
+    for y in range(69, 140):
+        gmap.set_tile(30, y, Tile(TileType.WATER, 0, False))
+    start = (0, 100)
+    goal = (40, 100)
+    detour = find_path_jps(start, goal, gmap, [])
+    expected = find_path(start, goal, gmap, [])
+    assert len(detour) > len(expected)
+    path = find_path_fast(start, goal, gmap, [])
+    assert path[0] == start and path[-1] == goal
+    assert len(path) == len(expected)
+
+
+def test_find_nearest_resource_prefers_shorter_path_over_closer_tile():
+    gmap = GameMap(seed=4)
+    for x in range(40, 61):
+        for y in range(40, 61):
+            gmap.set_tile(x, y, Tile(TileType.GRASS, 0, True))
+    for y in range(43, 58):
+        gmap.set_tile(48, y, Tile(TileType.WATER, 0, False))
+    gmap.set_tile(46, 50, Tile(TileType.ROCK, 10, True))
+    gmap.set_tile(50, 56, Tile(TileType.ROCK, 10, True))
+
+    pos, path = find_nearest_resource((50, 50), TileType.ROCK, gmap, [])
+    assert pos == (50, 56)
+    assert len(path) == 7
+
+
+def test_hierarchical_path_rebuilds_blocks_after_tile_change():
+    gmap = GameMap(seed=2)
+    start = (0, 0)
+    goal = (70, 0)
+    first = find_path_hierarchical(start, goal, gmap, [])
+    assert first[-1] == goal
+    for y in range(0, 40):
+        gmap.set_tile(40, y, Tile(TileType.WATER, 0, False))
+    path = find_path_hierarchical(start, goal, gmap, [])
+    assert path[0] == start and path[-1] == goal
+    assert all(gmap.get_tile(*p).passable for p in path)
+    for a, b in zip(path, path[1:]):
+        assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1
+
+
+def test_hierarchical_path_gives_up_on_enclosed_goal():
+    gmap = GameMap(seed=2)
+    for dx in range(-2, 3):
+        for dy in range(-2, 3):
+            tile = TileType.WATER if max(abs(dx), abs(dy)) == 2 else TileType.GRASS
+            gmap.set_tile(300 + dx, 300 + dy, Tile(tile, 0, tile is TileType.GRASS))
+    assert find_path_hierarchical((200, 300), (300, 300), gmap, []) == []
+    assert find_path((200, 300), (300, 300), gmap, []) == []
+
+
+def test_building_adjacent_path_stops_next_to_footprint():
+    gmap = GameMap(seed=5)
+    for x in range(0, 12):
+        for y in range(0, 12):
+            gmap.set_tile(x, y, Tile(TileType.GRASS, 0, True))
+    bp = BuildingBlueprint(
+        "Hall", 1, [(0, 0), (1, 0), (0, 1), (1, 1)], "H", Color.BUILDING
+    )
+    hall = Building(bp, (6, 6), passable=False)
+
+    path = find_path_to_building_adjacent((0, 0), hall, gmap, [hall])
+    assert path[0] == (0, 0)
+    assert path[-1] in {(5, 6), (6, 5)}
+    assert len(path) == 12
+    assert not set(path) & set(hall.cells())
+
+
+def test_nearest_passable_cache_follows_map_version():
+    gmap = GameMap(seed=6)
+    gmap.set_tile(20, 20, Tile(TileType.WATER, 0, False))
+    gmap.set_tile(21, 20, Tile(TileType.GRASS, 0, True))
+    first = nearest_passable((20, 20), gmap)
+    assert first != (20, 20)
+    assert gmap.get_tile(*first).passable
+
+    gmap.set_tile(20, 20, Tile(TileType.GRASS, 0, True))
+    assert nearest_passable((20, 20), gmap) == (20, 20)
+
+
+def test_find_path_leaves_window_for_long_detour():
+    gmap = GameMap(seed=7)
+    for x in range(0, 21):
+        for y in range(0, 45):
+            gmap.set_tile(x, y, Tile(TileType.GRASS, 0, True))
+    for y in range(0, 40):
+        gmap.set_tile(10, y, Tile(TileType.WATER, 0, False))
+    path = find_path((0, 0), (20, 0), gmap, [])
+    assert path[0] == (0, 0) and path[-1] == (20, 0)
+    # around the bottom of the wall: 20 across plus 40 down and back up
+    assert len(path) - 1 == 100
+    assert all(gmap.get_tile(*p).passable for p in path)
+
+
+def test_blocked_cells_follow_building_changes():
+    bp = BLUEPRINTS["House"]
+    house = Building(bp, (3, 3), passable=False)
+    buildings = [house]
+    assert _blocked_cells(buildings) == {(3, 3)}
+    house.passable = True
+    assert _blocked_cells(buildings) == set()
+    house.passable = False
+    buildings.append(Building(bp, (4, 3), passable=False))
+    assert _blocked_cells(buildings) == {(3, 3), (4, 3)}
+
+
+def test_building_index_tracks_moves_and_removals():
+    bp = BuildingBlueprint("Wide", 1, [(0, 0), (1, 0)], "W", Color.BUILDING)
+    index = BuildingIndex()
+    a = Building(bp, (0, 0), passable=False)
+    b = Building(bp, (1, 0), passable=False)
+    index.add(a)
+    index.add(b)
+    assert set(index.blocked()) == {(0, 0), (1, 0), (2, 0)}
+    index.remove(a)
+    # (1, 0) is still covered by ``b``
+    assert set(index.blocked()) == {(1, 0), (2, 0)}
+    b.position = (5, 5)
+    index.buildings.append(Building(bp, (0, 2), passable=True))
+    assert set(_blocked_cells(index)) == {(5, 5), (6, 5)}
+
+
+def test_bidirectional_search_rejects_enclosed_goal():
+    gmap = GameMap(seed=8)
+    cx, cy = 60, 60
+    for d in range(-2, 3):
+        ring = ((cx + d, cy - 2), (cx + d, cy + 2), (cx - 2, cy + d), (cx + 2, cy + d))
+        for x, y in ring:
+            gmap.set_tile(x, y, Tile(TileType.WATER, 0, False))
+    gmap.set_tile(cx, cy, Tile(TileType.GRASS, 0, True))
+    assert find_path_bidir((0, 0), (cx, cy), gmap, []) == []
+
+    gmap.set_tile(cx + 2, cy, Tile(TileType.GRASS, 0, True))
+    path = find_path_bidir((0, 0), (cx, cy), gmap, [])
+    assert path[0] == (0, 0) and path[-1] == (cx, cy)
+    for a, b in zip(path, path[1:]):
+        assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1
+
+
+def test_open_ground_search_heads_straight_for_goal(monkeypatch):
+    gmap = GameMap(seed=1)
+    monkeypatch.setattr(gmap, "passable", lambda x, y: True)
+    # Every shortest route ties on f; breaking ties towards the goal means
+    # only the cells of one route are expanded.
+    path = find_path((0, 0), (30, 30), gmap, [], search_limit=61)
+    assert len(path) == 61
+
+
+def test_game_path_cache_reuses_routes_until_buildings_change():
+    from src.game import Game
+
+    game = Game(seed=1)
+    x, y = game.townhall_pos
+    start, goal = (x, y + 12), (x + 6, y + 12)
+    for cx in range(x - 2, x + 9):
+        for cy in range(y + 10, y + 15):
+            game.map.set_tile(cx, cy, Tile(TileType.GRASS))
+    path = game.cached_path(start, goal)
+    assert path[0] == start and path[-1] == goal
+    assert game.cached_path(start, goal) is path
+    wall = BuildingBlueprint("Wall", 1, [(0, -1), (0, 0), (0, 1)], "#", Color.BUILDING)
+    game.building_index.add(Building(wall, (x + 3, y + 12), passable=False))
+    detour = game.cached_path(start, goal)
+    assert detour is not path
+    assert (x + 3, y + 12) not in detour and len(detour) > len(path)
+
+
+def test_game_path_cache_reverses_return_trips(monkeypatch):
+    import src.game as game_mod
+
+    game = game_mod.Game(seed=1)
+    x, y = game.townhall_pos
+    out = game.cached_path(game.storage_pos, (x - 3, y))
+    assert out
+    calls = []
+    monkeypatch.setattr(game_mod, "find_path_fast", lambda *a, **k: calls.append(a))
+    back = game.cached_path((x - 3, y), game.storage_pos)
+    assert calls == []
+    assert back == out[::-1]
@@ -1,5 +1,9 @@
+from collections import deque
+
 from src.game import Game
-from src.constants import Personality, Mood
+from src.constants import Personality, Mood, TileType
+from src.tile import Tile
+from src.villager import Villager
 
 
 def test_villager_has_personality_and_mood():
@@ -7,3 +11,62 @@ def test_villager_has_personality_and_mood():
     vill = game.entities[0]
     assert vill.personality in list(Personality)
     assert vill.mood is Mood.NEUTRAL
+
+
+def test_social_villager_cheered_by_neighbour_after_it_moves():
+    game = Game(seed=42)
+    vill = game.entities[0]
+    vill.personality = Personality.SOCIAL
+    vill.cooldown = 1
+    x, y = vill.position
+    other = Villager(id=2, position=(x + 2, y), cooldown=5)
+    game.entities.append(other)
+    vill.update(game)
+    assert vill.mood is Mood.NEUTRAL
+    other.target_path = deque([(x + 1, y)])
+    game.map.set_tile(x + 1, y, Tile(TileType.GRASS))
+    assert other._move_step(game)
+    vill.cooldown = 1
+    vill.update(game)
+    assert vill.mood is Mood.HAPPY
+    assert game.villagers_near((x + 2, y)) == [other]
+
+
+def test_action_delay_follows_trait_changes(monkeypatch):
+    import src.villager as villager_mod
+
+    monkeypatch.setattr(villager_mod.random, "uniform", lambda a, b: 1.0)
+    game = Game(seed=42)
+    vill = game.entities[0]
+    vill.personality = Personality.LAZY
+    assert vill._action_delay(game, 10) == 12
+    vill.adjust_mood(1)
+    assert vill._action_delay(game, 10) == 10
+    vill.personality = Personality.INDUSTRIOUS
+    assert vill._action_delay(game, 10) == 7
+
+
+def test_action_delay_jitter_follows_traits(monkeypatch):
+    import src.villager as villager_mod
+
+    monkeypatch.setattr(villager_mod.random, "uniform", lambda a, b: b)
+    game = Game(seed=42)
+    vill = game.entities[0]
+    vill.personality = Personality.LAZY
+    vill.adjust_mood(-1)
+    # 10 * 1.2 * 1.1 -> 13, then up to 14.4% slower
+    assert vill._action_delay(game, 10) == 14
+    vill.personality = Personality.INDUSTRIOUS
+    vill.adjust_mood(2)
+    # 10 * 0.8 * 0.9 -> 7, then up to 6.4% slower
+    assert vill._action_delay(game, 10) == 7
+
+
+def test_adjust_mood_clamps_at_both_ends():
+    vill = Villager(id=1, position=(0, 0))
+    vill.adjust_mood(5)
+    assert vill.mood is Mood.HAPPY
+    vill.adjust_mood(-1)
+    assert vill.mood is Mood.NEUTRAL
+    vill.adjust_mood(-3)
+    assert vill.mood is Mood.SAD
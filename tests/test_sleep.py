@@ -1,3 +1,5 @@
+import pytest
+
 from src.game import Game
 from src.building import Building
 
@@ -26,3 +28,29 @@ def test_villager_sleeps_and_wakes():
     vill.update(game)
     assert not vill.asleep
     assert vill.state != "sleep"
+
+
+class _NoScan(list):
+    def __iter__(self):
+        pytest.fail("scanned buildings while asleep")
+
+
+def test_sleeping_villager_skips_home_lookup():
+    game = Game(seed=1)
+    vill = game.entities[0]
+    bp = game.blueprints["House"]
+    home = Building(bp, (vill.x + 1, vill.y), progress=bp.build_time)
+    home.passable = True
+    game.buildings.append(home)
+    game._assign_home(vill)
+
+    game.world.tick_count = game.world.day_length * 23 // 24
+    for _ in range(10):
+        vill.update(game)
+        if vill.asleep:
+            break
+    assert vill.asleep
+    game.buildings = _NoScan(game.buildings)
+    for _ in range(5):
+        vill.update(game)
+    assert vill.asleep and vill.position == home.position
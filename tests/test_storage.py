@@ -35,3 +35,21 @@ def test_assign_builder_immediate_storage_adds_capacity():
     game._assign_builder(b)
     assert game.storage_capacity == prev + bp.capacity_bonus
 
+
+def test_delivery_empties_a_full_villager():
+    from src.game import Game
+    from src.villager import Villager
+
+    game = Game(seed=1)
+    vill = Villager(
+        id=5,
+        position=game.storage_pos,
+        state="deliver",
+        wood=6,
+        stone=4,
+    )
+    game.entities.append(vill)
+    assert vill.is_full()
+    vill.update(game)
+    assert vill.inventory == {"wood": 0, "stone": 0}
+    assert not vill.is_full()
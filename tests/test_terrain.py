@@ -0,0 +1,47 @@
+from src.terrain import TerrainGenerator, _hash01
+
+
+def test_hash_is_deterministic_and_in_unit_range():
+    values = [_hash01(x, y, 7) for x in range(50) for y in range(50)]
+    assert values == [_hash01(x, y, 7) for x in range(50) for y in range(50)]
+    assert all(0.0 <= v < 1.0 for v in values)
+    assert len(set(values)) > 2400
+    assert _hash01(3, 4, 7) != _hash01(3, 4, 8)
+
+
+def test_tile_at_batch_matches_tile_at():
+    gen = TerrainGenerator(seed=5)
+    xs = list(range(0, 400, 7))
+    ys = [x * 3 % 500 for x in xs]
+    assert gen.tile_at_batch(xs, ys) == [gen.tile_at(x, y) for x, y in zip(xs, ys)]
+
+
+def test_noise_corners_shared_within_a_lattice_cell():
+    gen = TerrainGenerator(seed=3)
+    gen._corners.clear()
+    values = [gen._value_noise(x, 7, scale=20) for x in range(20)]
+    assert len(gen._corners) == 1
+    fresh = TerrainGenerator(seed=3)
+    fresh._corners.clear()
+    assert fresh._value_noise(13, 7, scale=20) == values[13]
+
+
+def test_display_preview_prints_rows_as_they_are_generated(monkeypatch, capsys):
+    gen = TerrainGenerator(width=300, height=250, seed=2)
+    seen = []
+    real_stream = gen.preview_stream
+
+    def stream(scale):
+        for row in real_stream(scale):
+            seen.append(row)
+            yield row
+
+    monkeypatch.setattr(gen, "preview_stream", stream)
+    # Each sleep happens after exactly one more row has been generated
+    sleeps = []
+    monkeypatch.setattr(
+        "src.terrain.time.sleep", lambda delay: sleeps.append(len(seen))
+    )
+    gen.display_preview(scale=100, delay=0)
+    assert sleeps == [1, 2, 3]
+    assert capsys.readouterr().out.splitlines()[-1] == f"[{'#' * 20}] 100%"
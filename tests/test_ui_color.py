@@ -27,3 +27,184 @@ def test_ui_fixed_colour(monkeypatch):
     renderer.draw_grid([["X"]], [[Color.UI]])
 
     assert called["rgb"] == UI_COLOR_RGB
+
+
+def test_draw_grid_redraws_changed_rows_only(monkeypatch):
+    renderer = Renderer()
+    monkeypatch.setattr(renderer.term, "move_xy", lambda x, y: f"<{y}>")
+
+    written = []
+
+    class Dummy:
+        def write(self, s):
+            written.append(s)
+
+        def flush(self):
+            pass
+
+    monkeypatch.setattr(sys, "stdout", Dummy())
+
+    renderer.draw_grid([["a", "b"], ["c", "d"]])
+    written.clear()
+    renderer.draw_grid([["a", "b"], ["c", "x"]])
+    assert "".join(written) == "<1>cx"
+    written.clear()
+    renderer.draw_grid([["a", "b"], ["c", "x"]])
+    assert "".join(written) == ""
+
+
+def test_colour_escapes_resolved_once(monkeypatch):
+    renderer = Renderer()
+    monkeypatch.setattr(renderer.term, "move_xy", lambda x, y: "")
+
+    calls = []
+
+    def fake_color_rgb(r, g, b):
+        calls.append((r, g, b))
+        return "<rgb>"
+
+    monkeypatch.setattr(renderer.term, "color_rgb", fake_color_rgb)
+
+    written = []
+
+    class Dummy:
+        def write(self, s):
+            written.append(s)
+
+        def flush(self):
+            pass
+
+    monkeypatch.setattr(sys, "stdout", Dummy())
+
+    renderer.draw_grid([["a", "b"]], [[(1, 2, 3), None]])
+    renderer.draw_grid([["c", "d"]], [[(1, 2, 3), None]])
+    assert calls == [(1, 2, 3)]
+    assert written[-1] == "<rgb>cd"
+
+
+def test_status_line_erases_instead_of_padding(monkeypatch):
+    renderer = Renderer()
+    monkeypatch.setattr(renderer.term, "move_xy", lambda x, y: "")
+    monkeypatch.setattr(renderer.term, "color_rgb", lambda r, g, b: "")
+    monkeypatch.setattr(renderer.term, "clear_eol", "<eol>", raising=False)
+
+    written = []
+
+    class Dummy:
+        def write(self, s):
+            written.append(s)
+
+        def flush(self):
+            pass
+
+    monkeypatch.setattr(sys, "stdout", Dummy())
+
+    renderer.render_status("wood 5")
+    assert written == ["wood 5<eol>"]
+
+
+def test_row_moves_computed_once_per_size(monkeypatch):
+    renderer = Renderer()
+    moves = []
+
+    def fake_move(x, y):
+        moves.append((x, y))
+        return ""
+
+    monkeypatch.setattr(renderer.term, "move_xy", fake_move)
+
+    class Dummy:
+        def write(self, s):
+            pass
+
+        def flush(self):
+            pass
+
+    monkeypatch.setattr(sys, "stdout", Dummy())
+
+    renderer.draw_grid([["a"], ["b"]])
+    renderer.draw_grid([["c"], ["d"]])
+    assert moves == [(0, 0), (0, 1)]
+    renderer.draw_grid([["a", "b"]])
+    assert moves[2:] == [(0, 0)]
+
+
+def test_frame_written_to_file_descriptor(monkeypatch):
+    import os
+
+    renderer = Renderer()
+    monkeypatch.setattr(renderer.term, "move_xy", lambda x, y: "")
+    read_fd, write_fd = os.pipe()
+
+    class Stream:
+        encoding = "utf-8"
+
+        def fileno(self):
+            return write_fd
+
+        def write(self, s):
+            raise AssertionError("frame should bypass write()")
+
+        def flush(self):
+            pass
+
+    monkeypatch.setattr(sys, "stdout", Stream())
+    try:
+        renderer.draw_grid([["\xb7", "a"]])
+        assert os.read(read_fd, 64) == "\xb7a".encode("utf-8")
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_render_game_redraws_only_rows_overlays_touch(monkeypatch):
+    from types import SimpleNamespace
+
+    from src.camera import Camera
+    from src.constants import Mood
+    from src.map import GameMap
+
+    renderer = Renderer()
+    monkeypatch.setattr(renderer.term, "move_xy", lambda x, y: f"<{y}>")
+    monkeypatch.setattr(renderer.term, "color_rgb", lambda r, g, b: "")
+
+    written = []
+
+    class Dummy:
+        def write(self, s):
+            written.append(s)
+
+        def flush(self):
+            pass
+
+    monkeypatch.setattr(sys, "stdout", Dummy())
+
+    gmap = GameMap(seed=1)
+    camera = Camera()
+    vill = SimpleNamespace(x=3, y=4, mood=Mood.HAPPY, target_path=[])
+    renderer.render_game(gmap, camera, [vill], [])
+    written.clear()
+    vill.y = 6
+    renderer.render_game(gmap, camera, [vill], [])
+    rows = [part.split(">")[0] for part in "".join(written).split("<")[1:]]
+    assert rows == ["4", "6"]
+    assert renderer._dirty_rows is None
+
+
+def test_packed_colours_unpacked_for_terminal(monkeypatch):
+    renderer = Renderer()
+    monkeypatch.setattr(renderer.term, "move_xy", lambda x, y: "")
+    monkeypatch.setattr(renderer.term, "color_rgb", lambda r, g, b: f"<{r},{g},{b}>")
+    written = []
+
+    class Dummy:
+        def write(self, s):
+            written.append(s)
+
+        def flush(self):
+            pass
+
+    monkeypatch.setattr(sys, "stdout", Dummy())
+
+    renderer.draw_grid([["a", "b", "c"]], [[0x010203, 0x010203, (4, 5, 6)]])
+    assert written[-1] == "<1,2,3>ab<4,5,6>c"
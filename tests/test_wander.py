@@ -12,7 +12,7 @@ def test_villager_wanders_when_search_fails(monkeypatch):
     monkeypatch.setattr(
         villager_mod, "find_nearest_resource", lambda *a, **k: (None, [])
     )
-    monkeypatch.setattr(random, "shuffle", lambda x: None)
+    monkeypatch.setattr(random, "randrange", lambda n: 0)
 
     vill.update(game)
     assert vill.position != start
@@ -24,7 +24,7 @@ def test_villager_may_wander_when_idle(monkeypatch):
     start = vill.position
 
     monkeypatch.setattr(villager_mod.random, "random", lambda: 0.1)
-    monkeypatch.setattr(villager_mod.random, "shuffle", lambda x: None)
+    monkeypatch.setattr(villager_mod.random, "randrange", lambda n: 0)
 
     called = {"dispatch": False}
 
@@ -18,3 +18,15 @@ def test_watchtower_increases_search_limit():
     b.passable = False
     game.buildings.append(b)
     assert game.get_search_limit() > base_limit
+
+
+def test_building_counts_follow_upgrades():
+    game = Game(seed=42)
+    bp = game.blueprints["Watchtower"]
+    b = Building(bp, (game.townhall_pos[0] + 2, game.townhall_pos[1]))
+    b.progress = bp.build_time
+    game.buildings.append(b)
+    assert game._count_buildings("Watchtower") == 1
+    assert game._count_buildings("Watchtower", min_level=2) == 0
+    b.apply_upgrade()
+    assert game._count_buildings("Watchtower", min_level=2) == 1